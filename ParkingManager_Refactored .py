@@ -18,30 +18,65 @@ Improvements:
 """
 
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from logging.handlers import QueueHandler, QueueListener
+from types import MethodType
+from typing import Deque, Dict, List, Optional, Callable, Tuple
+import logging
+import queue
 import sys
 import os
+import time
+import weakref
 
-# Try to import from Vehicle_Refactored
-try:
-    from Vehicle_Refactored import Vehicle, VehicleType, ChargingCapability, VehicleFactory, VehicleSpecification, Car, Truck, Motorcycle, Bus
-except ImportError:
-    # Fallback if imports fail
-    pass
+# Vehicle_Refactored is required (module-level tables are built from
+# VehicleType). NumPy and Numba are optional and only power batch
+# rebilling; their guarded imports and the no-op njit fallback live there.
+from Vehicle_Refactored import (
+    Vehicle, VehicleType, SpaceSize, ChargingCapability, VehicleFactory,
+    VehicleSpecification, Car, Truck, Motorcycle, Bus, np, njit, prange
+)
 
+logger = logging.getLogger(__name__)
+
+
+# Number of completed tickets kept in memory by default
+DEFAULT_HISTORY_SIZE = 10_000
+
+# %-format of the printable ticket ID (e.g., "TKT1000"), shared by
+# ParkingTicket.display_id and the deferred-format log messages
+_TICKET_ID_FORMAT = "TKT%d"
+
+# Vehicle types in value order; a ticket's type_code (the type's int value)
+# indexes per-type rate tables
+_VEHICLE_TYPES = tuple(sorted(VehicleType))
 
-class ParkingSpaceSize(Enum):
-    """
-    Enumeration of parking space sizes.
-    
-    Provides clear categorization of parking spaces to match vehicle requirements.
-    """
-    COMPACT = "COMPACT"
-    STANDARD = "STANDARD"
-    LARGE = "LARGE"
+
+def _rate_table(rates: Dict[VehicleType, float], default: float) -> Tuple[float, ...]:
+    """Flatten a per-type rate dict into a tuple indexed by type code."""
+    return tuple(rates.get(vtype, default) for vtype in _VEHICLE_TYPES)
+
+
+def _without(table: Dict, key) -> Dict:
+    """Copy of a dict minus one key (for copy-on-write tables)."""
+    return {k: v for k, v in table.items() if k != key}
+
+
+# Parking space sizes are the same IntEnum vehicles declare their needs in,
+# so a vehicle's SPACE_SIZE is directly a key into the per-size free lists
+ParkingSpaceSize = SpaceSize
+
+# Member or size name (e.g. "COMPACT", from vehicles written against the
+# older string sizes) -> member
+_SIZE_CACHE: Dict[object, ParkingSpaceSize] = {
+    **{size: size for size in ParkingSpaceSize},
+    **{size.name: size for size in ParkingSpaceSize},
+}
 
 
 class ParkingSpaceStatus(Enum):
@@ -56,7 +91,7 @@ class ParkingSpaceStatus(Enum):
     MAINTENANCE = "MAINTENANCE"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParkingSpace:
     """
     Value Object representing a specific parking space.
@@ -65,12 +100,14 @@ class ParkingSpace:
     - Immutable identity for the space
     - Clear encapsulation of space properties
     - Easy to track and manage
+    - Slotted: no per-instance __dict__, so large lots stay compact
     """
     space_id: str
     size: ParkingSpaceSize
     status: ParkingSpaceStatus = field(default=ParkingSpaceStatus.AVAILABLE)
     floor: int = 1
     location: str = ""  # e.g., "A3", "B2"
+    position: Optional[float] = None  # distance along the lot, for spatial allocation
 
     def __post_init__(self):
         """Validate space properties."""
@@ -78,42 +115,117 @@ class ParkingSpace:
             raise ValueError("Space ID cannot be empty")
         if self.floor < 1:
             raise ValueError("Floor number must be positive")
+        if self.position is not None and self.position < 0:
+            raise ValueError("Position cannot be negative")
 
     def is_available(self) -> bool:
         """Check if space is available for parking."""
         return self.status == ParkingSpaceStatus.AVAILABLE
 
     def __str__(self) -> str:
-        return f"Space {self.space_id} (Floor {self.floor}, {self.size.value})"
+        return f"Space {self.space_id} (Floor {self.floor}, {self.size.name})"
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class ParkingTicket:
     """
     Value Object representing a parking ticket/entry.
     
     Tracks entry and exit times, vehicle information, and charges.
+    The vehicle type and whether it is an EV are captured once at creation
+    so pricing, observers and revenue reports don't re-inspect the vehicle
+    for every ticket.
+    
+    ticket_id is a plain integer; the printable "TKT1000" form is only
+    built on demand via display_id.
+    
+    Times are stored as integer epoch seconds (entry_ts/exit_ts) so duration
+    math allocates nothing; entry_time/exit_time expose them as datetimes.
     """
-    ticket_id: str
+    ticket_id: int
     vehicle: Vehicle
     space: ParkingSpace
-    entry_time: datetime
-    exit_time: Optional[datetime] = None
+    entry_ts: int
+    exit_ts: Optional[int] = None
     charge_amount: float = 0.0
+    vehicle_type: Optional[VehicleType] = None
+    is_ev: bool = field(default=False, init=False)
+    type_code: int = field(default=0, init=False)
+
+    def __init__(self, ticket_id: int, vehicle: Vehicle, space: ParkingSpace,
+                 entry_ts: Optional[int] = None, exit_ts: Optional[int] = None,
+                 charge_amount: float = 0.0,
+                 vehicle_type: Optional[VehicleType] = None, *,
+                 entry_time: Optional[datetime] = None,
+                 exit_time: Optional[datetime] = None):
+        """
+        Create a ticket, capturing the vehicle type (if not supplied), its
+        code and EV flag.
+        
+        Times are epoch seconds (entry_ts/exit_ts). Datetimes are accepted
+        too, as entry_time/exit_time keywords or in the entry_ts/exit_ts
+        positions, as when tickets stored datetimes.
+        
+        Raises:
+            TypeError: If neither entry_ts nor entry_time is given
+        """
+        if entry_time is not None:
+            entry_ts = entry_time
+        if exit_time is not None:
+            exit_ts = exit_time
+        if entry_ts is None:
+            raise TypeError("ParkingTicket requires entry_ts or entry_time")
+        if isinstance(entry_ts, datetime):
+            entry_ts = int(entry_ts.timestamp())
+        if isinstance(exit_ts, datetime):
+            exit_ts = int(exit_ts.timestamp())
+        self.ticket_id = ticket_id
+        self.vehicle = vehicle
+        self.space = space
+        self.entry_ts = entry_ts
+        self.exit_ts = exit_ts
+        self.charge_amount = charge_amount
+        if vehicle_type is None:
+            vehicle_type = vehicle.TYPE
+        self.vehicle_type = vehicle_type
+        self.type_code = int(vehicle_type)
+        self.is_ev = isinstance(vehicle, ChargingCapability)
+
+    @property
+    def display_id(self) -> str:
+        """Get the printable ticket identifier (e.g., "TKT1000")."""
+        return _TICKET_ID_FORMAT % self.ticket_id
+
+    @property
+    def entry_time(self) -> datetime:
+        """Get the entry time as a local datetime."""
+        return datetime.fromtimestamp(self.entry_ts)
+
+    @entry_time.setter
+    def entry_time(self, value: datetime) -> None:
+        self.entry_ts = int(value.timestamp())
+
+    @property
+    def exit_time(self) -> Optional[datetime]:
+        """Get the exit time as a local datetime (None while active)."""
+        return None if self.exit_ts is None else datetime.fromtimestamp(self.exit_ts)
+
+    @exit_time.setter
+    def exit_time(self, value: Optional[datetime]) -> None:
+        self.exit_ts = None if value is None else int(value.timestamp())
 
     def is_active(self) -> bool:
         """Check if vehicle is currently parked."""
-        return self.exit_time is None
+        return self.exit_ts is None
 
     def get_duration_hours(self) -> float:
-        """Get parking duration in hours."""
-        end_time = self.exit_time or datetime.now()
-        duration = end_time - self.entry_time
-        return duration.total_seconds() / 3600
+        """Get parking duration in hours (up to now for active tickets)."""
+        end_ts = self.exit_ts if self.exit_ts is not None else int(time.time())
+        return (end_ts - self.entry_ts) / 3600.0
 
     def __str__(self) -> str:
         status = "ACTIVE" if self.is_active() else "COMPLETED"
-        return (f"Ticket {self.ticket_id}: {self.vehicle.registration_number} "
+        return (f"Ticket {self.display_id}: {self.vehicle.registration_number} "
                 f"in {self.space} [{status}]")
 
 
@@ -172,6 +284,7 @@ class BasicPricingStrategy(PricingStrategy):
             VehicleType.TRUCK: 15.0,
             VehicleType.BUS: 15.0,
         }
+        self._rates = _rate_table(self._base_rates, 10.0)
         self._minimum_charge = 2.0
 
     def calculate_fee(self, ticket: ParkingTicket) -> float:
@@ -185,8 +298,7 @@ class BasicPricingStrategy(PricingStrategy):
             Calculated fee
         """
         duration_hours = max(ticket.get_duration_hours(), 0.5)  # Minimum 30 minutes
-        vehicle_type = ticket.vehicle.get_type()
-        hourly_rate = self._base_rates.get(vehicle_type, 10.0)
+        hourly_rate = self._rates[ticket.type_code]
         fee = duration_hours * hourly_rate
         return max(fee, self._minimum_charge)
 
@@ -211,29 +323,27 @@ class PeakHourPricingStrategy(PricingStrategy):
             VehicleType.TRUCK: 15.0,
             VehicleType.BUS: 15.0,
         }
+        self._rates = _rate_table(self._base_rates, 10.0)
+        # Multiplier for each local hour of the day:
+        # peak 9-11 AM and 5-7 PM, night 10 PM - 6 AM, otherwise off-peak
+        self._hour_multipliers = tuple(
+            1.5 if (9 <= hour < 12) or (17 <= hour < 19)
+            else 0.5 if hour >= 22 or hour < 6
+            else 1.0
+            for hour in range(24)
+        )
 
-    def _get_peak_multiplier(self, dt: datetime) -> float:
-        """Determine pricing multiplier based on time of day."""
-        hour = dt.hour
-        
-        # Peak hours: 9-11 AM and 5-7 PM
-        if (9 <= hour < 12) or (17 <= hour < 19):
-            return 1.5
-        # Night: 10 PM - 6 AM
-        elif hour >= 22 or hour < 6:
-            return 0.5
-        # Off-peak
-        else:
-            return 1.0
+    def _get_peak_multiplier(self, timestamp: int) -> float:
+        """Determine pricing multiplier based on local time of day."""
+        return self._hour_multipliers[time.localtime(timestamp).tm_hour]
 
     def calculate_fee(self, ticket: ParkingTicket) -> float:
         """Calculate fee with peak-hour multiplier."""
         duration_hours = max(ticket.get_duration_hours(), 0.5)
-        vehicle_type = ticket.vehicle.get_type()
-        hourly_rate = self._base_rates.get(vehicle_type, 10.0)
+        hourly_rate = self._rates[ticket.type_code]
         
         # Use peak multiplier from entry time
-        multiplier = self._get_peak_multiplier(ticket.entry_time)
+        multiplier = self._get_peak_multiplier(ticket.entry_ts)
         
         fee = duration_hours * hourly_rate * multiplier
         return max(fee, 2.0)
@@ -260,6 +370,7 @@ class SubscriptionPricingStrategy(PricingStrategy):
             VehicleType.TRUCK: 150.0,
             VehicleType.BUS: 150.0,
         }
+        self._rates = _rate_table(self._subscription_rates, 100.0)
 
     def calculate_fee(self, ticket: ParkingTicket) -> float:
         """
@@ -271,8 +382,7 @@ class SubscriptionPricingStrategy(PricingStrategy):
         Returns:
             Daily charge (subscription_rate / 30)
         """
-        vehicle_type = ticket.vehicle.get_type()
-        monthly_rate = self._subscription_rates.get(vehicle_type, 100.0)
+        monthly_rate = self._rates[ticket.type_code]
         daily_rate = monthly_rate / 30
         duration_days = max(ticket.get_duration_hours() / 24, 1)
         return duration_days * daily_rate
@@ -298,6 +408,7 @@ class EvChargingPricingStrategy(PricingStrategy):
             VehicleType.TRUCK: 7.5,
             VehicleType.BUS: 7.5,
         }
+        self._rates = _rate_table(self._base_rates, 5.0)
         self._charging_rate_per_kwh = 0.50
 
     def calculate_fee(self, ticket: ParkingTicket) -> float:
@@ -311,15 +422,14 @@ class EvChargingPricingStrategy(PricingStrategy):
             Total fee (parking + charging)
         """
         duration_hours = max(ticket.get_duration_hours(), 0.5)
-        vehicle_type = ticket.vehicle.get_type()
         
         # Base parking fee (50% of regular)
-        hourly_rate = self._base_rates.get(vehicle_type, 5.0)
+        hourly_rate = self._rates[ticket.type_code]
         parking_fee = duration_hours * hourly_rate
         
         # Charging fee (if vehicle has charging capability)
         charging_fee = 0.0
-        if isinstance(ticket.vehicle, ChargingCapability):
+        if ticket.is_ev:
             # Estimate: assume some energy was consumed
             estimated_consumption = duration_hours * 5.0  # 5 kWh per hour average
             charging_fee = estimated_consumption * self._charging_rate_per_kwh
@@ -331,6 +441,62 @@ class EvChargingPricingStrategy(PricingStrategy):
         return "EV Charging-Aware Pricing"
 
 
+# ============================================================================
+# BATCH BILLING: Compiled fee kernel for the built-in strategies
+# ============================================================================
+
+_KERNEL_BASIC = 0
+_KERNEL_PEAK_HOUR = 1
+_KERNEL_SUBSCRIPTION = 2
+_KERNEL_EV_CHARGING = 3
+
+
+@njit(parallel=True, cache=True)
+def _fee_kernel(entry_ts, exit_ts, type_codes, is_ev, utc_offsets, strategy_id,
+                rates, hour_multipliers, minimum_charge, charging_rate):
+    """Compute fees for many tickets at once; mirrors the strategies' math."""
+    charges = np.empty(entry_ts.shape[0])
+    for i in prange(entry_ts.shape[0]):
+        hours = (exit_ts[i] - entry_ts[i]) / 3600.0
+        rate = rates[type_codes[i]]
+        if strategy_id == _KERNEL_SUBSCRIPTION:
+            charges[i] = max(hours / 24.0, 1.0) * rate / 30.0
+        else:
+            billed_hours = max(hours, 0.5)
+            fee = billed_hours * rate
+            if strategy_id == _KERNEL_PEAK_HOUR:
+                fee *= hour_multipliers[(entry_ts[i] + utc_offsets[i]) // 3600 % 24]
+            elif strategy_id == _KERNEL_EV_CHARGING and is_ev[i]:
+                fee += billed_hours * 5.0 * charging_rate
+            charges[i] = max(fee, minimum_charge)
+    return charges
+
+
+def _kernel_parameters(strategy: PricingStrategy):
+    """
+    Get fee-kernel arguments for a built-in strategy.
+    
+    Returns:
+        (strategy_id, rates, hour_multipliers, minimum_charge, charging_rate),
+        or None if the strategy (or a subclass of it) must be priced in Python
+    """
+    flat = np.ones(24)
+    kind = type(strategy)
+    if kind is BasicPricingStrategy:
+        return (_KERNEL_BASIC, np.array(strategy._rates),
+                flat, strategy._minimum_charge, 0.0)
+    if kind is PeakHourPricingStrategy:
+        return (_KERNEL_PEAK_HOUR, np.array(strategy._rates),
+                np.array(strategy._hour_multipliers), 2.0, 0.0)
+    if kind is SubscriptionPricingStrategy:
+        return (_KERNEL_SUBSCRIPTION, np.array(strategy._rates),
+                flat, 0.0, 0.0)
+    if kind is EvChargingPricingStrategy:
+        return (_KERNEL_EV_CHARGING, np.array(strategy._rates),
+                flat, 2.0, strategy._charging_rate_per_kwh)
+    return None
+
+
 # ============================================================================
 # OBSERVER PATTERN: Event Notifications
 # ============================================================================
@@ -361,22 +527,64 @@ class ParkingEventObserver(ABC):
         """Called when a space becomes available."""
         pass
 
+    def on_bulk_entry(self, tickets: List[ParkingTicket]) -> None:
+        """
+        Called once when many vehicles are parked together.
+        
+        Defaults to one on_vehicle_entry call per ticket; override to handle
+        the batch in a single step.
+        """
+        for ticket in tickets:
+            self.on_vehicle_entry(ticket)
+
+
+# Entry log message; logging formats the ticket ID only if it is emitted
+_ENTRY_LOG_FORMAT = "Vehicle entry: ticket=" + _TICKET_ID_FORMAT + " reg=%s space=%s"
+
 
 class LoggingObserver(ParkingEventObserver):
-    """Observer that logs parking events."""
+    """
+    Observer that logs parking events at INFO level.
+    
+    Messages use logging's deferred %-formatting, so nothing is formatted
+    or written when INFO is disabled for this module's logger.
+    """
 
     def on_vehicle_entry(self, ticket: ParkingTicket) -> None:
         """Log vehicle entry."""
-        print(f"[LOG] Vehicle entry: {ticket}")
+        logger.info(_ENTRY_LOG_FORMAT, ticket.ticket_id, ticket.vehicle.registration_number,
+                    ticket.space.space_id)
 
     def on_vehicle_exit(self, ticket: ParkingTicket) -> None:
         """Log vehicle exit and charge."""
-        print(f"[LOG] Vehicle exit: {ticket.vehicle.registration_number}, "
-              f"Charge: ${ticket.charge_amount:.2f}")
+        logger.info("Vehicle exit: reg=%s charge=$%.2f",
+                    ticket.vehicle.registration_number, ticket.charge_amount)
 
     def on_space_available(self, space: ParkingSpace) -> None:
         """Log space availability."""
-        print(f"[LOG] Space available: {space}")
+        logger.info("Space available: %s", space)
+
+
+def start_background_logging(*handlers: logging.Handler) -> QueueListener:
+    """
+    Move this module's log I/O onto a background thread.
+    
+    Routes the module logger through a QueueHandler and starts a
+    QueueListener that forwards records to the given handlers (default: a
+    StreamHandler on stderr). Records no longer propagate to the root logger.
+    
+    Args:
+        handlers: Handlers that perform the actual output
+    
+    Returns:
+        The running listener; call stop() to flush and shut it down
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *(handlers or (logging.StreamHandler(),)))
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    listener.start()
+    return listener
 
 
 class ChargingStationObserver(ParkingEventObserver):
@@ -388,7 +596,7 @@ class ChargingStationObserver(ParkingEventObserver):
 
     def on_vehicle_entry(self, ticket: ParkingTicket) -> None:
         """Allocate charging spot if EV."""
-        if isinstance(ticket.vehicle, ChargingCapability):
+        if ticket.is_ev:
             self._charging_sessions[ticket.vehicle.registration_number] = ticket.vehicle
             print(f"[CHARGING] EV charging session started for {ticket.vehicle.registration_number}")
 
@@ -405,15 +613,29 @@ class ChargingStationObserver(ParkingEventObserver):
 
 
 class AvailabilityNotificationObserver(ParkingEventObserver):
-    """Observer that notifies users of available spaces."""
+    """
+    Observer that notifies users of available spaces.
+    
+    Bound-method subscribers are held weakly, so sessions that go away drop
+    off the waitlist on their own. A callback that raises is logged and
+    unsubscribed, so dead subscribers don't cost work on every event.
+    """
 
     def __init__(self):
         """Initialize notification observer."""
-        self._waitlist: List[Callable] = []
+        # Each entry returns the live callback, or None once it was collected
+        self._waitlist: List[Callable[[], Optional[Callable[[ParkingSpace], None]]]] = []
 
     def subscribe_to_availability(self, callback: Callable[[ParkingSpace], None]) -> None:
-        """Subscribe to availability notifications."""
-        self._waitlist.append(callback)
+        """
+        Subscribe to availability notifications.
+        
+        Bound methods are referenced weakly; plain functions are kept alive.
+        """
+        if isinstance(callback, MethodType):
+            self._waitlist.append(weakref.WeakMethod(callback))
+        else:
+            self._waitlist.append(lambda: callback)
 
     def on_vehicle_entry(self, ticket: ParkingTicket) -> None:
         """Entry events don't affect availability."""
@@ -426,11 +648,21 @@ class AvailabilityNotificationObserver(ParkingEventObserver):
     def on_space_available(self, space: ParkingSpace) -> None:
         """Notify all subscribers when space becomes available."""
         print(f"[NOTIFICATION] Space available: {space}")
-        for callback in self._waitlist:
+        stale = set()
+        for index, ref in enumerate(self._waitlist):
+            callback = ref()
+            if callback is None:
+                stale.add(index)
+                continue
             try:
                 callback(space)
             except Exception as e:
-                print(f"[ERROR] Notification callback failed: {e}")
+                stale.add(index)
+                logger.error("Notification callback %r failed and was unsubscribed: %s",
+                             callback, e)
+        if stale:
+            self._waitlist = [ref for index, ref in enumerate(self._waitlist)
+                              if index not in stale]
 
 
 # ============================================================================
@@ -457,19 +689,62 @@ class ParkingManager:
     pricing calculations to strategies and not hardcoding fee logic.
     """
 
-    def __init__(self, pricing_strategy: PricingStrategy):
+    def __init__(self, pricing_strategy: PricingStrategy,
+                 history_size: Optional[int] = DEFAULT_HISTORY_SIZE,
+                 target_fraction: Optional[float] = None):
         """
         Initialize the parking manager.
         
         Args:
             pricing_strategy: The pricing strategy to use for fee calculation
+            history_size: Maximum number of completed tickets to retain
+                (oldest are dropped first); None keeps the full history.
+                Revenue totals always cover every transaction.
+            target_fraction: Optional spatial allocation target tau in [0, 1].
+                When set, vehicles get the free space nearest tau * L, where
+                L is the largest space position (e.g., 0.5 for the middle of
+                the lot). None allocates the oldest free space.
+        
+        Raises:
+            ValueError: If target_fraction is outside [0, 1]
         """
+        if target_fraction is not None and not 0.0 <= target_fraction <= 1.0:
+            raise ValueError("Target fraction must be between 0 and 1")
         self._spaces: Dict[str, ParkingSpace] = {}
         self._active_tickets: Dict[str, ParkingTicket] = {}  # registration_number -> ticket
-        self._completed_tickets: List[ParkingTicket] = []
-        self._observers: List[ParkingEventObserver] = []
+        self._active_by_id: Dict[int, ParkingTicket] = {}  # ticket_id -> ticket
+        self._completed_tickets: Deque[ParkingTicket] = deque(maxlen=history_size)
+        # Running aggregates, updated on every exit
+        self._transaction_count = 0
+        self._total_revenue = 0.0
+        self._revenue_by_type: Dict[VehicleType, float] = defaultdict(float)
+        # Observers and their pre-bound per-event callbacks, keyed by
+        # id(observer); dicts keep attach order. The callback tables are
+        # copy-on-write (attach/detach rebind them rather than mutate), so
+        # an observer may attach or detach from inside a notification
+        self._observers: Dict[int, ParkingEventObserver] = {}
+        self._entry_callbacks: Dict[int, Callable[[ParkingTicket], None]] = {}
+        self._exit_callbacks: Dict[int, Callable[[ParkingTicket], None]] = {}
+        self._space_callbacks: Dict[int, Callable[[ParkingSpace], None]] = {}
+        self._bulk_entry_callbacks: Dict[int, Callable[[List[ParkingTicket]], None]] = {}
+        # Nesting depth of bulk_mode() blocks; notifications are skipped while > 0
+        self._muted = 0
         self._pricing_strategy = pricing_strategy
         self._next_ticket_id_counter = 1000
+        # Free-space index: size -> {space_id: space}, kept in insertion order
+        # so allocation stays deterministic while lookups and pops are O(1)
+        self._free_by_size: Dict[ParkingSpaceSize, Dict[str, ParkingSpace]] = {
+            size: {} for size in ParkingSpaceSize
+        }
+        self._occupied_count = 0
+        # Spatial index, only maintained when target_fraction is set:
+        # size -> sorted [(position, space_id)] of free spaces
+        self._target_fraction = target_fraction
+        self._lot_length = 0.0
+        self._space_positions: Dict[str, float] = {}
+        self._free_positions_by_size: Dict[ParkingSpaceSize, List[Tuple[float, str]]] = {
+            size: [] for size in ParkingSpaceSize
+        }
 
     # ========== Space Management ==========
 
@@ -485,7 +760,16 @@ class ParkingManager:
         """
         if space.space_id in self._spaces:
             raise ValueError(f"Space {space.space_id} already exists")
+        if self._target_fraction is not None:
+            # Spaces without an explicit position are laid out in insertion order
+            position = space.position if space.position is not None else float(len(self._spaces))
+            self._space_positions[space.space_id] = position
+            self._lot_length = max(self._lot_length, position)
         self._spaces[space.space_id] = space
+        if space.is_available():
+            self._release_space(space)
+        elif space.status == ParkingSpaceStatus.OCCUPIED:
+            self._occupied_count += 1
 
     def add_multiple_spaces(self, spaces: List[ParkingSpace]) -> None:
         """
@@ -501,23 +785,24 @@ class ParkingManager:
         """
         Get available parking spaces.
         
+        Reads from the free-space index instead of scanning every space.
+        
         Args:
             size: Optional filter by space size
         
         Returns:
             List of available spaces
         """
-        available = [space for space in self._spaces.values()
-                    if space.is_available()]
-        
-        if size:
-            available = [space for space in available if space.size == size]
-        
-        return available
+        if size is not None:
+            return list(self._free_by_size[size].values())
+        return [space for free in self._free_by_size.values()
+                for space in free.values()]
 
     def get_available_space_count(self, size: Optional[ParkingSpaceSize] = None) -> int:
-        """Get count of available spaces."""
-        return len(self.get_available_spaces(size))
+        """Get count of available spaces in O(1)."""
+        if size is not None:
+            return len(self._free_by_size[size])
+        return sum(len(free) for free in self._free_by_size.values())
 
     def get_occupancy_rate(self) -> float:
         """
@@ -528,9 +813,7 @@ class ParkingManager:
         """
         if not self._spaces:
             return 0.0
-        occupied = sum(1 for space in self._spaces.values()
-                      if space.status == ParkingSpaceStatus.OCCUPIED)
-        return (occupied / len(self._spaces)) * 100
+        return (self._occupied_count / len(self._spaces)) * 100
 
     # ========== Vehicle Entry/Exit ==========
 
@@ -545,39 +828,99 @@ class ParkingManager:
             ParkingTicket for the vehicle
         
         Raises:
-            ValueError: If no appropriate space available or vehicle already parked
+            ValueError: If no appropriate space available, the vehicle's space
+                size is unknown, or vehicle already parked
         """
         # Check if vehicle already parked
         if vehicle.registration_number in self._active_tickets:
             raise ValueError(f"Vehicle {vehicle.registration_number} is already parked")
 
         # Find appropriate space
-        required_size = vehicle.get_parking_space_size()
-        size_enum = ParkingSpaceSize[required_size]
-        available_spaces = self.get_available_spaces(size_enum)
-        
-        if not available_spaces:
-            raise ValueError(f"No available {required_size} space for {vehicle}")
+        size_enum = self._required_space_size(vehicle)
+        if not self._free_by_size[size_enum]:
+            raise ValueError(f"No available {size_enum.name} space for {vehicle}")
+
+        ticket = self._issue_ticket(vehicle, size_enum, int(time.time()))
+
+        # Notify observers
+        self._notify_entry(ticket)
+
+        return ticket
 
+    def park_vehicles_bulk(self, vehicles: List[Vehicle],
+                           notify: bool = False) -> List[ParkingTicket]:
+        """
+        Park many vehicles at once, e.g. when loading a simulation.
+        
+        Every vehicle is validated before any space is allocated, so either
+        all vehicles are parked or none are. Per-vehicle entry events are
+        skipped; with notify=True observers receive one on_bulk_entry event.
+        
+        Args:
+            vehicles: Vehicles to park, in allocation order
+            notify: Whether to emit a single bulk-entry event
+        
+        Returns:
+            ParkingTickets in the same order as vehicles
+        
+        Raises:
+            ValueError: If a vehicle is already parked or listed twice, its
+                space size is unknown, or there are not enough free spaces
+        """
+        sizes: List[ParkingSpaceSize] = []
+        needed: Dict[ParkingSpaceSize, int] = defaultdict(int)
+        registrations = set()
+        for vehicle in vehicles:
+            registration_number = vehicle.registration_number
+            if registration_number in self._active_tickets or registration_number in registrations:
+                raise ValueError(f"Vehicle {registration_number} is already parked")
+            registrations.add(registration_number)
+            size = self._required_space_size(vehicle)
+            needed[size] += 1
+            sizes.append(size)
+
+        for size, count in needed.items():
+            if count > len(self._free_by_size[size]):
+                raise ValueError(f"Not enough available {size.name} spaces "
+                                 f"for {count} vehicles")
+
+        entry_ts = int(time.time())
+        tickets = [self._issue_ticket(vehicle, size, entry_ts)
+                   for vehicle, size in zip(vehicles, sizes)]
+
+        if notify:
+            self._notify_bulk_entry(tickets)
+
+        return tickets
+
+    def _required_space_size(self, vehicle: Vehicle) -> ParkingSpaceSize:
+        """Resolve the space size a vehicle needs."""
+        required_size = vehicle.SPACE_SIZE
+        size_enum = _SIZE_CACHE.get(required_size)
+        if size_enum is None:
+            raise ValueError(f"Unknown parking space size: {required_size}")
+        return size_enum
+
+    def _issue_ticket(self, vehicle: Vehicle, size: ParkingSpaceSize,
+                      entry_ts: int) -> ParkingTicket:
+        """Allocate a free space of the given size and record a new ticket."""
         # Allocate space
-        space = available_spaces[0]
+        space = self._take_free_space(size)
         space.status = ParkingSpaceStatus.OCCUPIED
+        self._occupied_count += 1
 
         # Create ticket
         ticket = ParkingTicket(
-            ticket_id=f"TKT{self._next_ticket_id_counter}",
+            ticket_id=self._next_ticket_id_counter,
             vehicle=vehicle,
             space=space,
-            entry_time=datetime.now()
+            entry_ts=entry_ts
         )
         self._next_ticket_id_counter += 1
 
         # Store ticket
         self._active_tickets[vehicle.registration_number] = ticket
-
-        # Notify observers
-        self._notify_entry(ticket)
-
+        self._active_by_id[ticket.ticket_id] = ticket
         return ticket
 
     def retrieve_vehicle(self, registration_number: str) -> ParkingTicket:
@@ -597,16 +940,22 @@ class ParkingManager:
             raise ValueError(f"Vehicle {registration_number} not found in parking")
 
         ticket = self._active_tickets.pop(registration_number)
-        ticket.exit_time = datetime.now()
+        del self._active_by_id[ticket.ticket_id]
+        ticket.exit_ts = int(time.time())
 
         # Calculate fee
         ticket.charge_amount = self._pricing_strategy.calculate_fee(ticket)
 
         # Free up space
         ticket.space.status = ParkingSpaceStatus.AVAILABLE
+        self._release_space(ticket.space)
+        self._occupied_count -= 1
 
         # Store completed ticket
         self._completed_tickets.append(ticket)
+        self._transaction_count += 1
+        self._total_revenue += ticket.charge_amount
+        self._revenue_by_type[ticket.vehicle_type] += ticket.charge_amount
 
         # Notify observers
         self._notify_exit(ticket)
@@ -614,6 +963,41 @@ class ParkingManager:
 
         return ticket
 
+    def _take_free_space(self, size: ParkingSpaceSize) -> ParkingSpace:
+        """
+        Remove and return a free space of the given size from the index.
+        
+        Without a target fraction this is the oldest free space (O(1)).
+        Otherwise it is the free space nearest the target position: the
+        search is a binary search over the sorted positions (O(log N)), but
+        removing the entry from the sorted list shifts it (O(N) worst case,
+        a fast memmove for lot-sized lists).
+        """
+        free_spaces = self._free_by_size[size]
+        if self._target_fraction is None:
+            return free_spaces.pop(next(iter(free_spaces)))
+
+        entries = self._free_positions_by_size[size]
+        target = self._target_fraction * self._lot_length
+        i = bisect_left(entries, (target,))
+        # Step back when the left neighbour is at least as close
+        if i == len(entries) or (i > 0 and target - entries[i - 1][0] <= entries[i][0] - target):
+            i -= 1
+        _, space_id = entries.pop(i)
+        return free_spaces.pop(space_id)
+
+    def _release_space(self, space: ParkingSpace) -> None:
+        """
+        Return a space to the free-space index.
+        
+        O(1) without a target fraction; otherwise the sorted insert is an
+        O(log N) search plus an O(N) worst-case list shift.
+        """
+        self._free_by_size[space.size][space.space_id] = space
+        if self._target_fraction is not None:
+            insort(self._free_positions_by_size[space.size],
+                   (self._space_positions[space.space_id], space.space_id))
+
     # ========== Pricing & Revenue ==========
 
     def set_pricing_strategy(self, strategy: PricingStrategy) -> None:
@@ -626,47 +1010,130 @@ class ParkingManager:
         print(f"[INFO] Changing pricing strategy to: {strategy.get_strategy_name()}")
         self._pricing_strategy = strategy
 
+    def rebill_all(self, strategy: Optional[PricingStrategy] = None):
+        """
+        Recalculate fees for every retained completed ticket in one batch.
+        
+        Built-in strategies are priced by a vectorized kernel (compiled in
+        parallel when Numba is installed). Other strategies, or environments
+        without NumPy, fall back to calling calculate_fee per ticket.
+        Tickets are not modified.
+        
+        Args:
+            strategy: Strategy to rebill with (default: the current strategy)
+        
+        Returns:
+            Fees in history order, as a NumPy array when NumPy is installed,
+            otherwise as a list
+        """
+        if strategy is None:
+            strategy = self._pricing_strategy
+        tickets = self._completed_tickets
+        params = _kernel_parameters(strategy) if np is not None else None
+        if params is None:
+            charges = [strategy.calculate_fee(ticket) for ticket in tickets]
+            return np.array(charges) if np is not None else charges
+
+        n = len(tickets)
+        entry_ts = np.fromiter((t.entry_ts for t in tickets), dtype=np.int64, count=n)
+        exit_ts = np.fromiter((t.exit_ts for t in tickets), dtype=np.int64, count=n)
+        codes = np.fromiter((t.type_code for t in tickets),
+                            dtype=np.int64, count=n)
+        is_ev = np.fromiter((t.is_ev for t in tickets), dtype=np.bool_, count=n)
+        # Local UTC offset at each entry (it changes across DST transitions);
+        # only the peak-hour math reads it. Transitions fall on hour
+        # boundaries, so look it up once per distinct entry hour
+        if params[0] == _KERNEL_PEAK_HOUR:
+            hours, hour_index = np.unique(entry_ts // 3600, return_inverse=True)
+            hour_offsets = np.fromiter(
+                (time.localtime(hour * 3600).tm_gmtoff for hour in hours.tolist()),
+                dtype=np.int64, count=hours.shape[0])
+            utc_offsets = hour_offsets[hour_index]
+        else:
+            utc_offsets = np.zeros(n, dtype=np.int64)
+        return _fee_kernel(entry_ts, exit_ts, codes, is_ev, utc_offsets, *params)
+
     def get_current_strategy_name(self) -> str:
         """Get name of current pricing strategy."""
         return self._pricing_strategy.get_strategy_name()
 
     def get_total_revenue(self) -> float:
-        """Calculate total revenue from all completed tickets."""
-        return sum(ticket.charge_amount for ticket in self._completed_tickets)
+        """Get total revenue from all completed tickets."""
+        return self._total_revenue
 
     def get_revenue_by_vehicle_type(self) -> Dict[VehicleType, float]:
         """Get revenue breakdown by vehicle type."""
-        revenue = {}
-        for ticket in self._completed_tickets:
-            vtype = ticket.vehicle.get_type()
-            revenue[vtype] = revenue.get(vtype, 0.0) + ticket.charge_amount
-        return revenue
+        return dict(self._revenue_by_type)
 
     # ========== Observer Management ==========
 
     def attach_observer(self, observer: ParkingEventObserver) -> None:
-        """Attach an observer to receive events."""
-        self._observers.append(observer)
+        """Attach an observer to receive events (attaching twice is a no-op)."""
+        key = id(observer)
+        self._observers[key] = observer
+        self._entry_callbacks = {**self._entry_callbacks, key: observer.on_vehicle_entry}
+        self._exit_callbacks = {**self._exit_callbacks, key: observer.on_vehicle_exit}
+        self._space_callbacks = {**self._space_callbacks, key: observer.on_space_available}
+        self._bulk_entry_callbacks = {**self._bulk_entry_callbacks,
+                                      key: observer.on_bulk_entry}
 
     def detach_observer(self, observer: ParkingEventObserver) -> None:
-        """Detach an observer."""
-        if observer in self._observers:
-            self._observers.remove(observer)
+        """
+        Detach an observer.
+        
+        Safe to call from inside a notification: dispatch in progress keeps
+        iterating the tables it started with, later events skip the observer.
+        """
+        key = id(observer)
+        if self._observers.pop(key, None) is not None:
+            self._entry_callbacks = _without(self._entry_callbacks, key)
+            self._exit_callbacks = _without(self._exit_callbacks, key)
+            self._space_callbacks = _without(self._space_callbacks, key)
+            self._bulk_entry_callbacks = _without(self._bulk_entry_callbacks, key)
+
+    @contextmanager
+    def bulk_mode(self):
+        """
+        Suspend observer notifications for the duration of a with-block.
+        
+        Useful for bulk traffic (batch imports, simulations) where per-event
+        callbacks would dominate the cost. Observers stay attached (and may
+        be attached or detached inside the block) and are notified again
+        once the outermost block exits. Blocks may be nested.
+        """
+        self._muted += 1
+        try:
+            yield self
+        finally:
+            self._muted -= 1
 
     def _notify_entry(self, ticket: ParkingTicket) -> None:
         """Notify all observers of vehicle entry."""
-        for observer in self._observers:
-            observer.on_vehicle_entry(ticket)
+        if self._muted:
+            return
+        for callback in self._entry_callbacks.values():
+            callback(ticket)
+
+    def _notify_bulk_entry(self, tickets: List[ParkingTicket]) -> None:
+        """Notify all observers of a bulk vehicle entry."""
+        if self._muted:
+            return
+        for callback in self._bulk_entry_callbacks.values():
+            callback(tickets)
 
     def _notify_exit(self, ticket: ParkingTicket) -> None:
         """Notify all observers of vehicle exit."""
-        for observer in self._observers:
-            observer.on_vehicle_exit(ticket)
+        if self._muted:
+            return
+        for callback in self._exit_callbacks.values():
+            callback(ticket)
 
     def _notify_space_available(self, space: ParkingSpace) -> None:
         """Notify all observers of space availability."""
-        for observer in self._observers:
-            observer.on_space_available(space)
+        if self._muted:
+            return
+        for callback in self._space_callbacks.values():
+            callback(space)
 
     # ========== Reporting ==========
 
@@ -674,11 +1141,23 @@ class ParkingManager:
         """Get list of currently parked vehicles."""
         return [ticket.vehicle for ticket in self._active_tickets.values()]
 
+    def get_active_ticket(self, ticket_id: int) -> Optional[ParkingTicket]:
+        """Look up an active ticket by its ID (None if not active)."""
+        return self._active_by_id.get(ticket_id)
+
+    def get_history(self) -> List[ParkingTicket]:
+        """
+        Get the retained completed tickets, oldest first.
+        
+        Bounded by history_size; revenue totals still cover every
+        transaction, including ones that have aged out.
+        """
+        return list(self._completed_tickets)
+
     def get_parking_summary(self) -> Dict:
         """Get comprehensive parking lot summary."""
         total_spaces = len(self._spaces)
-        occupied = sum(1 for space in self._spaces.values()
-                      if space.status == ParkingSpaceStatus.OCCUPIED)
+        occupied = self._occupied_count
         available = total_spaces - occupied
 
         return {
@@ -689,7 +1168,7 @@ class ParkingManager:
             "pricing_strategy": self.get_current_strategy_name(),
             "total_revenue": self.get_total_revenue(),
             "active_vehicles": len(self._active_tickets),
-            "total_transactions": len(self._completed_tickets),
+            "total_transactions": self._transaction_count,
         }
 
     def print_summary(self) -> None:
@@ -714,6 +1193,7 @@ if __name__ == "__main__":
     print("="*70)
     print("PARKING MANAGEMENT SYSTEM - DEMONSTRATION")
     print("="*70)
+    logging.basicConfig(level=logging.INFO, format="[LOG] %(message)s", stream=sys.stdout)
 
     # Initialize parking manager with basic pricing
     manager = ParkingManager(BasicPricingStrategy())
@@ -741,7 +1221,7 @@ if __name__ == "__main__":
     car_spec = VehicleSpecification("ABC123", "Honda", "Civic", "Blue")
     car = Car(car_spec)
     ticket1 = manager.park_vehicle(car)
-    print(f"Parked: {car}, Ticket: {ticket1.ticket_id}")
+    print(f"Parked: {car}, Ticket: {ticket1.display_id}")
 
     motorcycle_spec = VehicleSpecification("MOT456", "Harley", "Street", "Black")
     motorcycle = manager.park_vehicle(VehicleFactory.create_vehicle(
@@ -780,7 +1260,7 @@ if __name__ == "__main__":
     # Display revenue breakdown
     print("Revenue by Vehicle Type:")
     for vtype, amount in manager.get_revenue_by_vehicle_type().items():
-        print(f"  {vtype.value}: ${amount:.2f}")
+        print(f"  {vtype.label}: ${amount:.2f}")
 
     # Demonstrate strategy switching
     print("\n--- Switching to Peak Hour Pricing ---")
@@ -13,13 +13,33 @@ Design Improvements:
 5. Proper encapsulation and separation of concerns
 """
 
-from abc import ABC, abstractmethod
-from enum import Enum
-from dataclasses import dataclass
-from typing import Optional
-
-
-class VehicleType(Enum):
+from enum import IntEnum
+from functools import lru_cache
+from typing import List, Optional, Sequence
+import sys
+
+# NumPy and Numba are optional. NumPy powers the batch (array) APIs; Numba,
+# if also present, compiles their kernels. Without it, njit is a no-op and
+# the same kernels run as plain Python. Other modules import np/njit/prange
+# from here so the fallback is defined once.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+class VehicleType(IntEnum):
     """
     Enum for vehicle types - provides type safety and prevents string-based
     type identification throughout the codebase.
@@ -28,14 +48,54 @@ class VehicleType(Enum):
     - Eliminates magic strings
     - IDE autocomplete support
     - Exhaustiveness checking in switch-like statements
+    - Integer-valued: hashes as its int, and the values are dense from 0
+      so per-type tables can be plain tuples indexed by the value
+    
+    The human-readable name ("Car") is available as .label.
     """
-    CAR = "Car"
-    TRUCK = "Truck"
-    MOTORCYCLE = "Motorcycle"
-    BUS = "Bus"
+    CAR = 0
+    TRUCK = 1
+    MOTORCYCLE = 2
+    BUS = 3
+
+    @property
+    def label(self) -> str:
+        """Get the display name (e.g., "Car")."""
+        return _VEHICLE_TYPE_LABELS[self]
+
+
+_VEHICLE_TYPE_LABELS = {
+    VehicleType.CAR: "Car",
+    VehicleType.TRUCK: "Truck",
+    VehicleType.MOTORCYCLE: "Motorcycle",
+    VehicleType.BUS: "Bus",
+}
+
+
+class SpaceSize(IntEnum):
+    """
+    Enum for parking space sizes a vehicle can require.
+    
+    Integer-valued, so size comparisons and size-keyed lookups are integer
+    operations rather than string compares. Prints as its name
+    (e.g., "COMPACT"), matching the former string sizes in output.
+    """
+    COMPACT = 0
+    STANDARD = 1
+    LARGE = 2
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.name, format_spec)
+
+
+# Error-message labels for the specification fields (all must be non-blank),
+# in constructor order
+_REQUIRED_FIELD_LABELS = ("Registration number", "Make", "Model", "Color")
 
 
-@dataclass(frozen=True)
 class VehicleSpecification:
     """
     Value Object representing immutable vehicle specifications.
@@ -45,41 +105,105 @@ class VehicleSpecification:
     - Value-based equality comparison
     - Easier to use in sets/dicts
     - Clear semantic intent
+    - Slotted: no per-instance __dict__, one spec is created per vehicle
     
     This follows the Value Object pattern from Domain-Driven Design,
     distinguishing between vehicles with identical specs and unique vehicles.
+    
+    A hand-written slotted class rather than a dataclass: construction is a
+    plain __init__ assigning four slots, and the hash is computed once up
+    front. Immutability is by convention, so fields must not be reassigned
+    after creation (the cached hash would go stale).
+    
+    Field validation is a debug-time check: it is compiled out under
+    python -O, where inputs are expected to be validated at the boundary.
     """
-    registration_number: str
-    make: str
-    model: str
-    color: str
-
-    def __post_init__(self):
-        """Validate specifications upon creation."""
-        if not self.registration_number or not self.registration_number.strip():
-            raise ValueError("Registration number cannot be empty")
-        if not self.make or not self.make.strip():
-            raise ValueError("Make cannot be empty")
-        if not self.model or not self.model.strip():
-            raise ValueError("Model cannot be empty")
-        if not self.color or not self.color.strip():
-            raise ValueError("Color cannot be empty")
-
-
-class Vehicle(ABC):
+
+    __slots__ = ("registration_number", "make", "model", "color", "_hash")
+
+    def __init__(self, registration_number: str, make: str, model: str, color: str):
+        """
+        Create a specification, validating fields (skipped under python -O).
+        
+        Raises:
+            ValueError: If any field is empty or blank
+        """
+        if __debug__:
+            values = (registration_number, make, model, color)
+            for label, value in zip(_REQUIRED_FIELD_LABELS, values):
+                if not value or value.isspace():
+                    raise ValueError(f"{label} cannot be empty")
+        # Interned so vehicles can compare registrations by identity
+        self.registration_number = sys.intern(registration_number)
+        self.make = make
+        self.model = model
+        self.color = color
+        self._hash = hash((self.registration_number, make, model, color))
+
+    def __hash__(self) -> int:
+        """Hash on all fields (precomputed)."""
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        """Specifications are equal if all their fields match."""
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self._hash == other._hash
+                and self.registration_number is other.registration_number
+                and self.make == other.make
+                and self.model == other.model
+                and self.color == other.color)
+
+    def __repr__(self) -> str:
+        return (f"VehicleSpecification(registration_number={self.registration_number!r}, "
+                f"make={self.make!r}, model={self.model!r}, color={self.color!r})")
+
+
+class Vehicle:
     """
     Abstract base class for all vehicles.
     
     Implements the Template Method pattern where concrete vehicle types
-    define their specific behavior through getType().
+    define their specific behavior through the TYPE and SPACE_SIZE class
+    attributes. Hot paths read those directly; get_type() and
+    get_parking_space_size() remain as the method-style interface.
+    Every concrete subclass must define both attributes; this is checked
+    when the subclass is created (intermediate bases pass abstract=True).
     
     Design improvements over original:
-    - Abstract base ensures all vehicles implement required methods
+    - Abstract base: only concrete vehicle types can be instantiated
+      (a "quick ABC": __abstractmethods__ is set directly instead of using
+      ABCMeta, so isinstance checks against Vehicle stay on the fast path)
     - Encapsulated specification data in immutable Value Object
     - Private attributes with public interface (proper encapsulation)
     - Separation of vehicle identity from parking context
+    - Slotted: no per-instance __dict__ (subclasses declare empty __slots__)
     """
 
+    __slots__ = ("_specification", "_str_cache")
+
+    # Set by each concrete subclass
+    TYPE: VehicleType
+    SPACE_SIZE: SpaceSize
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs):
+        """
+        Require concrete vehicle types to declare TYPE and SPACE_SIZE.
+        
+        Intermediate base classes opt out with a class keyword, e.g.
+        `class ElectricVehicleBase(Vehicle, abstract=True)`; like Vehicle,
+        they can't be instantiated until a subclass defines both.
+        """
+        super().__init_subclass__(**kwargs)
+        missing = [name for name in ("TYPE", "SPACE_SIZE") if not hasattr(cls, name)]
+        if abstract:
+            cls.__abstractmethods__ = frozenset(missing)
+        elif missing:
+            raise TypeError(f"Vehicle subclass {cls.__name__} must define "
+                            f"{' and '.join(missing)} (or be declared abstract=True)")
+
     def __init__(self, specification: VehicleSpecification):
         """
         Initialize a vehicle with its specifications.
@@ -89,6 +213,7 @@ class Vehicle(ABC):
                           registration_number, make, model, color
         """
         self._specification = specification
+        self._str_cache = None
 
     @property
     def registration_number(self) -> str:
@@ -115,18 +240,16 @@ class Vehicle(ABC):
         """Get the complete vehicle specification (immutable)."""
         return self._specification
 
-    @abstractmethod
     def get_type(self) -> VehicleType:
         """
-        Return the vehicle type. Must be implemented by subclasses.
+        Return the vehicle type (the subclass's TYPE).
         
         Returns:
             VehicleType enum value identifying the vehicle category
         """
-        pass
+        return self.TYPE
 
-    @abstractmethod
-    def get_parking_space_size(self) -> str:
+    def get_parking_space_size(self) -> SpaceSize:
         """
         Return the required parking space size for this vehicle.
         
@@ -134,90 +257,75 @@ class Vehicle(ABC):
         supporting the Strategy pattern for space allocation.
         
         Returns:
-            str describing the space requirement (e.g., "COMPACT", "STANDARD", "LARGE")
+            SpaceSize describing the space requirement (COMPACT, STANDARD, LARGE)
         """
-        pass
+        return self.SPACE_SIZE
 
     def __str__(self) -> str:
-        """String representation for logging and debugging."""
-        return (f"{self.get_type().value} ({self.make} {self.model}) "
-                f"- Registration: {self.registration_number}, Color: {self.color}")
+        """String representation for logging and debugging (built once)."""
+        if self._str_cache is None:
+            spec = self._specification
+            self._str_cache = (f"{self.TYPE.label} ({spec.make} {spec.model}) "
+                               f"- Registration: {spec.registration_number}, "
+                               f"Color: {spec.color}")
+        return self._str_cache
 
     def __eq__(self, other) -> bool:
         """Vehicles are equal if their registration numbers match."""
+        if self is other:
+            return True
         if not isinstance(other, Vehicle):
             return False
-        return self.registration_number == other.registration_number
+        # Registration numbers are interned by VehicleSpecification
+        return (self._specification.registration_number
+                is other._specification.registration_number)
 
     def __hash__(self) -> int:
         """Hash based on registration number for use in sets/dicts."""
         return hash(self.registration_number)
 
 
-class Car(Vehicle):
-    """
-    Concrete implementation for standard automobiles.
-    
-    A Car requires standard parking spaces and follows typical
-    parking lot pricing rules.
-    """
+# Refuse direct instantiation of Vehicle without going through ABCMeta: the
+# base class itself has no TYPE or SPACE_SIZE
+Vehicle.__abstractmethods__ = frozenset({"TYPE", "SPACE_SIZE"})
 
-    def get_type(self) -> VehicleType:
-        """Car vehicles have type CAR."""
-        return VehicleType.CAR
 
-    def get_parking_space_size(self) -> str:
-        """Cars require standard parking spaces."""
-        return "STANDARD"
+def _define_vehicle_class(name: str, vehicle_type: VehicleType,
+                          space_size: SpaceSize, doc: str) -> type:
+    """Build a concrete Vehicle subclass from its type and space size."""
+    return type(name, (Vehicle,), {
+        "__slots__": (),
+        "__doc__": doc,
+        "__module__": __name__,
+        "TYPE": vehicle_type,
+        "SPACE_SIZE": space_size,
+    })
 
 
-class Truck(Vehicle):
-    """
+# Concrete vehicle types: adding one is a single line here (plus its enum
+# member and factory entry)
+Car = _define_vehicle_class("Car", VehicleType.CAR, SpaceSize.STANDARD, """
+    Concrete implementation for standard automobiles.
+    
+    A Car requires standard parking spaces and follows typical
+    parking lot pricing rules.
+    """)
+Truck = _define_vehicle_class("Truck", VehicleType.TRUCK, SpaceSize.LARGE, """
     Concrete implementation for trucks/large vehicles.
     
     Trucks require larger parking spaces due to their size.
-    """
-
-    def get_type(self) -> VehicleType:
-        """Truck vehicles have type TRUCK."""
-        return VehicleType.TRUCK
-
-    def get_parking_space_size(self) -> str:
-        """Trucks require large parking spaces."""
-        return "LARGE"
-
-
-class Motorcycle(Vehicle):
-    """
+    """)
+Motorcycle = _define_vehicle_class("Motorcycle", VehicleType.MOTORCYCLE, SpaceSize.COMPACT, """
     Concrete implementation for motorcycles/scooters.
     
     Motorcycles require compact parking spaces due to their small size.
-    """
-
-    def get_type(self) -> VehicleType:
-        """Motorcycle vehicles have type MOTORCYCLE."""
-        return VehicleType.MOTORCYCLE
-
-    def get_parking_space_size(self) -> str:
-        """Motorcycles require compact parking spaces."""
-        return "COMPACT"
-
-
-class Bus(Vehicle):
-    """
+    """)
+Bus = _define_vehicle_class("Bus", VehicleType.BUS, SpaceSize.LARGE, """
     Concrete implementation for buses/large public transport vehicles.
     
     Buses require the largest parking spaces and may have special
     parking area requirements.
-    """
-
-    def get_type(self) -> VehicleType:
-        """Bus vehicles have type BUS."""
-        return VehicleType.BUS
-
-    def get_parking_space_size(self) -> str:
-        """Buses require large parking spaces."""
-        return "LARGE"
+    """)
 
 
 # ============================================================================
@@ -248,10 +356,18 @@ class ChargingCapability:
         spec = VehicleSpecification("ABC123", "Tesla", "Model 3", "White")
         car = Car(spec)
         electric_car = ChargingCapability(car, max_charge=100)
-        print(electric_car.get_type())  # VehicleType.CAR
+        print(electric_car.get_type().label)  # Car
         electric_car.charge(50)
     """
 
+    # Identity fields and the vehicle's behaviour are cached per instance at
+    # decoration time, so reading them is a plain slot load; anything else
+    # falls through to the decorated vehicle via __getattr__
+    __slots__ = ("_vehicle", "registration_number", "make", "model", "color",
+                 "TYPE", "SPACE_SIZE", "get_type", "get_parking_space_size",
+                 "_max_charge_kwh", "_current_charge_kwh", "_inv_max_times_100",
+                 "_str_prefix")
+
     def __init__(self, vehicle: Vehicle, max_charge_kwh: float = 100.0):
         """
         Initialize a vehicle with charging capability.
@@ -267,8 +383,21 @@ class ChargingCapability:
             raise ValueError("Maximum charge must be positive")
         
         self._vehicle = vehicle
-        self._max_charge_kwh = max_charge_kwh
+        spec = vehicle.specification
+        self.registration_number = spec.registration_number
+        self.make = spec.make
+        self.model = spec.model
+        self.color = spec.color
+        self.TYPE = vehicle.TYPE
+        self.SPACE_SIZE = vehicle.SPACE_SIZE
+        self.get_type = vehicle.get_type
+        self.get_parking_space_size = vehicle.get_parking_space_size
+        self._max_charge_kwh = float(max_charge_kwh)
+        # Percent per kWh, so percentage queries multiply instead of divide
+        self._inv_max_times_100 = 100.0 / max_charge_kwh
         self._current_charge_kwh = 0.0
+        # Invariant part of __str__; only the battery state is formatted per call
+        self._str_prefix = f"🔌 {vehicle} [Battery: "
 
     @property
     def max_charge(self) -> float:
@@ -283,7 +412,7 @@ class ChargingCapability:
     @property
     def charge_percentage(self) -> float:
         """Get current charge as percentage (0-100)."""
-        return (self._current_charge_kwh / self._max_charge_kwh) * 100
+        return self._current_charge_kwh * self._inv_max_times_100
 
     def charge(self, amount_kwh: float) -> float:
         """
@@ -301,10 +430,14 @@ class ChargingCapability:
         if amount_kwh < 0:
             raise ValueError("Charge amount cannot be negative")
         
-        remaining_capacity = self._max_charge_kwh - self._current_charge_kwh
-        actual_charge = min(amount_kwh, remaining_capacity)
-        self._current_charge_kwh += actual_charge
-        return actual_charge
+        new_charge = self._current_charge_kwh + amount_kwh
+        if new_charge > self._max_charge_kwh:
+            # Battery fills: only the remaining capacity is charged
+            actual_charge = self._max_charge_kwh - self._current_charge_kwh
+            self._current_charge_kwh = self._max_charge_kwh
+            return actual_charge
+        self._current_charge_kwh = new_charge
+        return amount_kwh
 
     def discharge(self, amount_kwh: float) -> float:
         """
@@ -340,133 +473,287 @@ class ChargingCapability:
         Returns:
             True if current charge is below threshold
         """
-        return self.charge_percentage < threshold_percent
-
-    # Delegation: forward vehicle property access to decorated vehicle
-    @property
-    def registration_number(self) -> str:
-        """Get the vehicle's registration number."""
-        return self._vehicle.registration_number
-
-    @property
-    def make(self) -> str:
-        """Get the vehicle manufacturer."""
-        return self._vehicle.make
-
-    @property
-    def model(self) -> str:
-        """Get the vehicle model."""
-        return self._vehicle.model
+        return self._current_charge_kwh * self._inv_max_times_100 < threshold_percent
 
-    @property
-    def color(self) -> str:
-        """Get the vehicle color."""
-        return self._vehicle.color
-
-    def get_type(self) -> VehicleType:
-        """Get the underlying vehicle type."""
-        return self._vehicle.get_type()
-
-    def get_parking_space_size(self) -> str:
-        """Get the underlying vehicle's space requirement."""
-        return self._vehicle.get_parking_space_size()
+    def __getattr__(self, name):
+        """Delegate any other attribute (e.g. specification) to the vehicle."""
+        if name == "_vehicle":
+            # Not yet initialised (e.g. during copying); avoid recursing
+            raise AttributeError(name)
+        return getattr(self._vehicle, name)
 
     def __str__(self) -> str:
         """String representation including charging capability."""
-        base_str = str(self._vehicle)
-        return (f"🔌 {base_str} [Battery: {self.charge_percentage:.1f}% "
+        return (f"{self._str_prefix}{self.charge_percentage:.1f}% "
                 f"({self._current_charge_kwh:.1f}/{self._max_charge_kwh:.1f} kWh)]")
 
 
 # ============================================================================
-# FACTORY PATTERN: VehicleFactory
+# BATCH OPERATIONS: VehicleBatch
 # ============================================================================
 
-class VehicleFactory:
+@njit(parallel=True, cache=True)
+def _charge_kernel(current, max_charge, amounts, charged):
+    """Clamped in-place charge of every battery; mirrors charge()."""
+    for i in prange(current.shape[0]):
+        new_charge = current[i] + amounts[i]
+        if new_charge > max_charge[i]:
+            charged[i] = max_charge[i] - current[i]
+            current[i] = max_charge[i]
+        else:
+            charged[i] = amounts[i]
+            current[i] = new_charge
+
+
+@njit(parallel=True, cache=True)
+def _discharge_kernel(current, amounts, discharged):
+    """Clamped in-place discharge of every battery; mirrors discharge()."""
+    for i in prange(current.shape[0]):
+        if amounts[i] > current[i]:
+            discharged[i] = current[i]
+            current[i] = 0.0
+        else:
+            discharged[i] = amounts[i]
+            current[i] -= amounts[i]
+
+
+class VehicleBatch:
     """
-    Factory for creating vehicle instances safely and consistently.
+    Column-oriented view of many electric vehicles for fleet-wide operations.
     
-    **Benefits:**
-    - Centralizes vehicle creation logic
-    - Enables validation of creation parameters
-    - Reduces coupling between client code and vehicle classes
-    - Single point of change for vehicle instantiation
-    - Supports future extensions (logging, tracking, etc.)
+    Battery state is held in NumPy arrays (one entry per vehicle), so scans
+    such as "which vehicles are low on battery?" run as single vectorized
+    operations instead of Python loops over ChargingCapability objects.
+    The per-vehicle OO API stays the place for individual logic; call
+    to_vehicles() to write the batch state back.
     
-    This implements the Factory Method pattern, providing a single
-    interface for creating different vehicle types.
+    Requires NumPy. Charging and discharging run as compiled parallel
+    kernels when Numba is installed (the same kernels, interpreted, otherwise).
+    
+    Example usage:
+        batch = VehicleBatch.from_vehicles(fleet)
+        batch.charge_all(10.0)
+        needs_charge = batch.registration_numbers[batch.low_battery_mask()]
+        batch.to_vehicles()
     """
 
-    _VEHICLE_TYPES = {
-        VehicleType.CAR: Car,
-        VehicleType.TRUCK: Truck,
-        VehicleType.MOTORCYCLE: Motorcycle,
-        VehicleType.BUS: Bus,
-    }
-
-    @staticmethod
-    def create_vehicle(vehicle_type: VehicleType,
-                      registration_number: str,
-                      make: str,
-                      model: str,
-                      color: str) -> Vehicle:
+    __slots__ = ("_vehicles", "registration_numbers", "makes",
+                 "current_charge", "max_charge")
+
+    def __init__(self, vehicles: Sequence[ChargingCapability]):
         """
-        Create a vehicle instance with validation.
+        Build a batch from existing electric vehicles.
         
         Args:
-            vehicle_type: The type of vehicle to create (VehicleType enum)
-            registration_number: Vehicle registration/license plate
-            make: Vehicle manufacturer
-            model: Vehicle model name
-            color: Vehicle color
-        
-        Returns:
-            Vehicle instance of the specified type
+            vehicles: ChargingCapability-decorated vehicles
         
         Raises:
-            ValueError: If parameters are invalid or vehicle type unknown
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("VehicleBatch requires NumPy")
+        n = len(vehicles)
+        self._vehicles = list(vehicles)
+        self.registration_numbers = np.empty(n, dtype=object)
+        self.makes = np.empty(n, dtype=object)
+        self.registration_numbers[:] = [v.registration_number for v in vehicles]
+        self.makes[:] = [v.make for v in vehicles]
+        self.current_charge = np.fromiter(
+            (v._current_charge_kwh for v in vehicles), dtype=np.float64, count=n)
+        self.max_charge = np.fromiter(
+            (v._max_charge_kwh for v in vehicles), dtype=np.float64, count=n)
+
+    @classmethod
+    def from_vehicles(cls, vehicles: Sequence[ChargingCapability]) -> "VehicleBatch":
+        """Build a batch from existing electric vehicles."""
+        return cls(vehicles)
+
+    def __len__(self) -> int:
+        return len(self._vehicles)
+
+    def _per_vehicle(self, amounts_kwh):
+        """Broadcast a scalar or per-vehicle amount to one value per vehicle."""
+        return np.ascontiguousarray(np.broadcast_to(
+            np.asarray(amounts_kwh, dtype=np.float64), self.current_charge.shape))
+
+    def charge_all(self, amounts_kwh):
         """
-        if vehicle_type not in VehicleFactory._VEHICLE_TYPES:
-            raise ValueError(f"Unknown vehicle type: {vehicle_type}")
+        Charge every vehicle in the batch.
         
-        # Create specification (validation happens in VehicleSpecification)
-        spec = VehicleSpecification(registration_number, make, model, color)
+        Args:
+            amounts_kwh: Energy to add in kWh, one value for all vehicles
+                         or an array with one value per vehicle
         
-        # Create and return vehicle instance
-        vehicle_class = VehicleFactory._VEHICLE_TYPES[vehicle_type]
-        return vehicle_class(spec)
-
-    @staticmethod
-    def create_electric_vehicle(vehicle_type: VehicleType,
-                               registration_number: str,
-                               make: str,
-                               model: str,
-                               color: str,
-                               max_charge_kwh: float = 100.0) -> ChargingCapability:
-        """
-        Create an electric vehicle (vehicle with charging capability).
+        Returns:
+            Array of the amounts actually charged (capped at capacity)
         
-        This method demonstrates the power of composition: we create a regular
-        vehicle and decorate it with charging capability.
+        Raises:
+            ValueError: If any amount is negative
+        """
+        amounts = self._per_vehicle(amounts_kwh)
+        if (amounts < 0).any():
+            raise ValueError("Charge amount cannot be negative")
+        charged = np.empty_like(amounts)
+        _charge_kernel(self.current_charge, self.max_charge, amounts, charged)
+        return charged
+
+    def discharge_all(self, amounts_kwh):
+        """
+        Discharge every vehicle in the batch (simulate usage).
         
         Args:
-            vehicle_type: The type of vehicle to create
-            registration_number: Vehicle registration/license plate
-            make: Vehicle manufacturer
-            model: Vehicle model name
-            color: Vehicle color
-            max_charge_kwh: Maximum battery capacity (default: 100 kWh)
+            amounts_kwh: Energy to consume in kWh, one value for all vehicles
+                         or an array with one value per vehicle
         
         Returns:
-            ChargingCapability-decorated vehicle instance
+            Array of the amounts actually discharged
         
         Raises:
-            ValueError: If parameters are invalid
+            ValueError: If any amount is negative
+        """
+        amounts = self._per_vehicle(amounts_kwh)
+        if (amounts < 0).any():
+            raise ValueError("Discharge amount cannot be negative")
+        discharged = np.empty_like(amounts)
+        _discharge_kernel(self.current_charge, amounts, discharged)
+        return discharged
+
+    def charge_percentages(self):
+        """Get each vehicle's charge as a percentage (0-100)."""
+        return self.current_charge / self.max_charge * 100
+
+    def low_battery_mask(self, threshold_percent: float = 20.0):
+        """Get a boolean mask of vehicles below the threshold percentage."""
+        return self.current_charge / self.max_charge * 100 < threshold_percent
+
+    def total_charge(self) -> float:
+        """Get the combined charge of the batch in kWh."""
+        return float(self.current_charge.sum())
+
+    def to_vehicles(self) -> List[ChargingCapability]:
+        """
+        Write the batch battery state back to the vehicles.
+        
+        Returns:
+            The vehicles, in batch order
         """
-        base_vehicle = VehicleFactory.create_vehicle(
-            vehicle_type, registration_number, make, model, color
-        )
-        return ChargingCapability(base_vehicle, max_charge_kwh)
+        for vehicle, charge in zip(self._vehicles, self.current_charge.tolist()):
+            vehicle._current_charge_kwh = charge
+        return self._vehicles
+
+
+# ============================================================================
+# FACTORY PATTERN: VehicleFactory
+# ============================================================================
+
+# Concrete classes in VehicleType value order, so the public enum maps to
+# its class with a tuple index rather than an enum-keyed dict lookup
+_VEHICLE_CLASSES = tuple(sorted((Car, Truck, Motorcycle, Bus),
+                                key=lambda cls: cls.TYPE))
+
+
+def _build_vehicle(vehicle_class: type, registration_number: str,
+                   make: str, model: str, color: str) -> Vehicle:
+    """Construct a vehicle (validation happens in VehicleSpecification)."""
+    return vehicle_class(VehicleSpecification(registration_number, make, model, color))
+
+
+# Flyweight, not a registry: identical creation requests share one immutable
+# Vehicle, and entries may be evicted at any time
+_shared_vehicle = lru_cache(maxsize=4096)(_build_vehicle)
+
+
+def create_vehicle(vehicle_type: VehicleType,
+                   registration_number: str,
+                   make: str,
+                   model: str,
+                   color: str) -> Vehicle:
+    """
+    Create a vehicle instance with validation.
+    
+    Vehicles are immutable, so repeated calls with identical arguments
+    may return the same shared instance.
+    
+    Args:
+        vehicle_type: The type of vehicle to create (VehicleType enum)
+        registration_number: Vehicle registration/license plate
+        make: Vehicle manufacturer
+        model: Vehicle model name
+        color: Vehicle color
+    
+    Returns:
+        Vehicle instance of the specified type
+    
+    Raises:
+        ValueError: If parameters are invalid or vehicle type unknown
+    """
+    # Index the class table by the type's int value. Plain ints are accepted
+    # as type codes; bools (and other int-likes) are not
+    if (isinstance(vehicle_type, bool) or not isinstance(vehicle_type, int)
+            or not 0 <= vehicle_type < len(_VEHICLE_CLASSES)):
+        raise ValueError(f"Unknown vehicle type: {vehicle_type}")
+    vehicle_class = _VEHICLE_CLASSES[vehicle_type]
+    try:
+        return _shared_vehicle(vehicle_class, registration_number, make, model, color)
+    except TypeError:
+        # Unhashable arguments can't be cache keys; build uncached so the
+        # specification's own validation reports them
+        return _build_vehicle(vehicle_class, registration_number, make, model, color)
+
+
+def create_electric_vehicle(vehicle_type: VehicleType,
+                            registration_number: str,
+                            make: str,
+                            model: str,
+                            color: str,
+                            max_charge_kwh: float = 100.0) -> ChargingCapability:
+    """
+    Create an electric vehicle (vehicle with charging capability).
+    
+    This function demonstrates the power of composition: we create a regular
+    vehicle and decorate it with charging capability.
+    
+    Args:
+        vehicle_type: The type of vehicle to create
+        registration_number: Vehicle registration/license plate
+        make: Vehicle manufacturer
+        model: Vehicle model name
+        color: Vehicle color
+        max_charge_kwh: Maximum battery capacity (default: 100 kWh)
+    
+    Returns:
+        ChargingCapability-decorated vehicle instance
+    
+    Raises:
+        ValueError: If parameters are invalid
+    """
+    base_vehicle = create_vehicle(
+        vehicle_type, registration_number, make, model, color
+    )
+    return ChargingCapability(base_vehicle, max_charge_kwh)
+
+
+class VehicleFactory:
+    """
+    Factory for creating vehicle instances safely and consistently.
+    
+    **Benefits:**
+    - Centralizes vehicle creation logic
+    - Enables validation of creation parameters
+    - Reduces coupling between client code and vehicle classes
+    - Single point of change for vehicle instantiation
+    - Supports future extensions (logging, tracking, etc.)
+    
+    This implements the Factory Method pattern, providing a single
+    interface for creating different vehicle types.
+    
+    The factory methods are the module-level create_vehicle() and
+    create_electric_vehicle(); this class keeps the VehicleFactory.*
+    spelling working. Hot paths should call the functions directly.
+    """
+
+    create_vehicle = staticmethod(create_vehicle)
+    create_electric_vehicle = staticmethod(create_electric_vehicle)
 
 
 # ============================================================================
@@ -478,7 +765,7 @@ if __name__ == "__main__":
     spec_car = VehicleSpecification("ABC123", "Honda", "Civic", "Blue")
     car = Car(spec_car)
     print(f"Regular Car: {car}")
-    print(f"Type: {car.get_type().value}")
+    print(f"Type: {car.get_type().label}")
     print(f"Space Required: {car.get_parking_space_size()}\n")
 
     # Create an electric car using factory
@@ -10,29 +10,103 @@ This script demonstrates all features of the refactored parking management syste
 Run this script to see the system in action!
 """
 
+import io
+import logging
+import sys
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime, timedelta
-from Vehicle_Refactored import (
-    Vehicle, VehicleType, VehicleSpecification, VehicleFactory,
-    ChargingCapability, Car, Truck, Motorcycle, Bus
+# VehicleType is needed by the demo tables below; the parking module (and
+# its NumPy/Numba kernels) is imported inside the demos that use it.
+# np is the optional NumPy import (None when NumPy is not installed).
+from Vehicle_Refactored import VehicleType, VehicleFactory, np
+
+# Separator lines, built once
+_HEAVY_RULE = "=" * 70
+_LIGHT_RULE = "-" * 70
+_BOX_FILL = "═" * 68
+_BOX_BLANK = " " * 68
+
+# Title banner, laid out once at import
+_TITLE = "PARKING MANAGEMENT SYSTEM - DESIGN PATTERNS DEMO".center(68)
+_BANNER = (
+    "\n\n"
+    f"╔{_BOX_FILL}╗\n"
+    f"║{_BOX_BLANK}║\n"
+    f"║{_TITLE}║\n"
+    f"║{_BOX_BLANK}║\n"
+    f"╚{_BOX_FILL}╝\n"
+)
+
+# Pre-parsed row templates for the report tables
+_COMPARISON_ROW = "{:<10} ${:>10.2f} ${:>10.2f} ${:>10.2f}".format
+_REVENUE_ROW = "  {:<15}: ${:>8.2f} ({:>5.1f}%)".format
+
+# Static demo data, built once at import
+# (type, registration, make, model, color)
+_STRATEGY_DEMO_VEHICLES = (
+    (VehicleType.CAR, "CA001", "Toyota", "Camry", "Red"),
+    (VehicleType.CAR, "CA002", "Honda", "Accord", "Blue"),
+    (VehicleType.MOTORCYCLE, "MO001", "Suzuki", "GSX-R", "Black"),
+    (VehicleType.MOTORCYCLE, "MO002", "Yamaha", "YZF-R1", "White"),
 )
-from ParkingManager_Refactored import (
-    ParkingManager, ParkingSpace, ParkingSpaceSize, ParkingSpaceStatus,
-    BasicPricingStrategy, PeakHourPricingStrategy, LoggingObserver,
-    ChargingStationObserver
+# (type, registration, make, model, color, hours parked)
+_REPORTING_TRANSACTIONS = (
+    (VehicleType.CAR, "A123", "Toyota", "Camry", "Red", 2),
+    (VehicleType.CAR, "B456", "Honda", "Accord", "Blue", 1.5),
+    (VehicleType.MOTORCYCLE, "M789", "Harley", "Street", "Black", 0.75),
+    (VehicleType.TRUCK, "T001", "Ford", "F-150", "White", 3),
+    (VehicleType.CAR, "C111", "Tesla", "Model 3", "Silver", 4),
 )
 
+# Console handler for the demo's log lines; buffered_output() points it at
+# the same buffer as print() so the two stay interleaved in order
+_LOG_HANDLER = logging.StreamHandler(sys.stdout)
+_LOG_HANDLER.setFormatter(logging.Formatter("[LOG] %(message)s"))
+
+
+@contextmanager
+def buffered_output():
+    """
+    Collect everything printed or logged in the block and write it to
+    stdout in a single call at the end (including when the block fails).
+    """
+    buffer = io.StringIO()
+    previous_stream = _LOG_HANDLER.setStream(buffer)
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        _LOG_HANDLER.setStream(previous_stream)
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+def revenue_by_type(manager):
+    """
+    Get the manager's running revenue totals per vehicle type.
+    
+    These cover every transaction (like the summary's total revenue), not
+    just the retained ticket history.
+    
+    Returns:
+        Dict of VehicleType -> revenue, in VehicleType order, covering only
+        types that have tickets
+    """
+    totals = manager.get_revenue_by_vehicle_type()
+    return {vtype: totals[vtype] for vtype in VehicleType if vtype in totals}
+
 
 def print_header(title):
     """Print a formatted section header."""
-    print("\n" + "="*70)
+    print("\n" + _HEAVY_RULE)
     print(f"  {title}")
-    print("="*70)
+    print(_HEAVY_RULE)
 
 
 def print_subheader(title):
     """Print a formatted subsection header."""
     print(f"\n>>> {title}")
-    print("-" * 70)
+    print(_LIGHT_RULE)
 
 
 def demo_factory_pattern():
@@ -61,7 +135,7 @@ def demo_factory_pattern():
     print("Created vehicles:")
     for vehicle in vehicles:
         print(f"  • {vehicle}")
-        print(f"    - Type: {vehicle.get_type().value}")
+        print(f"    - Type: {vehicle.get_type().label}")
         print(f"    - Parking Space: {vehicle.get_parking_space_size()}\n")
     
     print("✓ Factory Pattern Benefits:")
@@ -123,6 +197,11 @@ def demo_decorator_pattern():
 
 def demo_parking_basic():
     """Demonstrate basic parking operations."""
+    from ParkingManager_Refactored import (
+        ParkingManager, ParkingSpace, ParkingSpaceSize, BasicPricingStrategy,
+        LoggingObserver, ChargingStationObserver
+    )
+    
     print_header("DEMO 3: PARKING OPERATIONS - Basic")
     
     print_subheader("Setting up parking lot")
@@ -162,13 +241,13 @@ def demo_parking_basic():
     
     # Park vehicles
     ticket1 = manager.park_vehicle(car)
-    print(f"✓ Car parked: {ticket1.ticket_id} in {ticket1.space}\n")
+    print(f"✓ Car parked: {ticket1.display_id} in {ticket1.space}\n")
     
     ticket2 = manager.park_vehicle(motorcycle)
-    print(f"✓ Motorcycle parked: {ticket2.ticket_id} in {ticket2.space}\n")
+    print(f"✓ Motorcycle parked: {ticket2.display_id} in {ticket2.space}\n")
     
     ticket3 = manager.park_vehicle(truck)
-    print(f"✓ Truck parked: {ticket3.ticket_id} in {ticket3.space}\n")
+    print(f"✓ Truck parked: {ticket3.display_id} in {ticket3.space}\n")
     
     # Show occupancy
     print_subheader("Parking lot status")
@@ -179,8 +258,9 @@ def demo_parking_basic():
     print_subheader("Retrieving vehicles")
     
     # Simulate time passing
-    ticket1.entry_time = datetime.now() - timedelta(hours=2)
-    ticket2.entry_time = datetime.now() - timedelta(minutes=45)
+    now = datetime.now()
+    ticket1.entry_time = now - timedelta(hours=2)
+    ticket2.entry_time = now - timedelta(minutes=45)
     
     # Retrieve vehicles
     exit1 = manager.retrieve_vehicle("ABC123")
@@ -200,76 +280,62 @@ def demo_parking_basic():
 
 def demo_strategy_pattern(manager):
     """Demonstrate the Strategy Pattern for pricing."""
+    from ParkingManager_Refactored import PeakHourPricingStrategy
+    
     print_header("DEMO 4: STRATEGY PATTERN - Dynamic Pricing")
     
     print_subheader("Switching pricing strategies")
     print("The Strategy pattern allows us to change algorithms at runtime.\n")
     
-    # Create multiple vehicles
-    vehicles_data = [
-        (VehicleType.CAR, "CA001", "Toyota", "Camry", "Red"),
-        (VehicleType.CAR, "CA002", "Honda", "Accord", "Blue"),
-        (VehicleType.MOTORCYCLE, "MO001", "Suzuki", "GSX-R", "Black"),
-        (VehicleType.MOTORCYCLE, "MO002", "Yamaha", "YZF-R1", "White"),
-    ]
-    
-    print("Current Strategy: Basic Hourly Rate")
-    print(f"Current Strategy Name: {manager.get_current_strategy_name()}\n")
-    
-    print("Parking vehicles with BASIC pricing...")
-    tickets = []
-    for vtype, reg, make, model, color in vehicles_data:
-        vehicle = VehicleFactory.create_vehicle(vtype, reg, make, model, color)
-        ticket = manager.park_vehicle(vehicle)
-        tickets.append(ticket)
-    
-    # Simulate time passing
-    for i, ticket in enumerate(tickets):
-        ticket.entry_time = datetime.now() - timedelta(hours=3)
+    strategy_name = manager.get_current_strategy_name()
+    print(f"Current Strategy: {strategy_name}")
+    print(f"Current Strategy Name: {strategy_name}\n")
     
-    print("Retrieving all vehicles with BASIC pricing...")
+    # Park, back-date and retrieve each vehicle in a single pass
+    print("Parking and retrieving vehicles with BASIC pricing...")
+    vehicles = [VehicleFactory.create_vehicle(*row) for row in _STRATEGY_DEMO_VEHICLES]
+    now = datetime.now()
+    three_hours_ago = now - timedelta(hours=3)
     basic_charges = {}
-    for reg, _, _, _, _ in vehicles_data:
-        exit_ticket = manager.retrieve_vehicle(reg)
-        basic_charges[reg] = exit_ticket.charge_amount
-        print(f"  {reg}: ${exit_ticket.charge_amount:.2f}")
-    
-    print("\n" + "-"*70)
+    with manager.bulk_mode():
+        for vehicle in vehicles:
+            reg = vehicle.registration_number
+            ticket = manager.park_vehicle(vehicle)
+            ticket.entry_time = three_hours_ago  # Simulate time passing
+            exit_ticket = manager.retrieve_vehicle(reg)
+            basic_charges[reg] = exit_ticket.charge_amount
+            print(f"  {reg}: ${exit_ticket.charge_amount:.2f}")
+    print(f"  ({len(basic_charges)} park/retrieve cycles, observers muted)")
+    
+    print("\n" + _LIGHT_RULE)
     print("SWITCHING TO PEAK HOUR PRICING...")
     manager.set_pricing_strategy(PeakHourPricingStrategy())
     print(f"New Strategy Name: {manager.get_current_strategy_name()}\n")
     
-    # Park same vehicles again with peak hour strategy
-    print("Parking same vehicles with PEAK HOUR pricing...")
-    tickets2 = []
-    for vtype, reg, make, model, color in vehicles_data:
-        vehicle = VehicleFactory.create_vehicle(vtype, reg, make, model, color)
-        # Modify reg number for second parking
-        vehicle._specification.registration_number = reg + "_2"
-        ticket = manager.park_vehicle(vehicle)
-        tickets2.append(ticket)
-    
-    # Set entry time to peak hour (10 AM)
-    peak_time = datetime.now().replace(hour=10, minute=0, second=0)
-    for ticket in tickets2:
-        ticket.entry_time = peak_time - timedelta(hours=3)
-    
-    print("Retrieving vehicles parked during PEAK HOURS...")
+    # Park same vehicles again with peak hour strategy, entering 3 hours
+    # before the 10 AM peak
+    print("Parking and retrieving same vehicles during PEAK HOURS...")
+    peak_entry = now.replace(hour=10, minute=0, second=0) - timedelta(hours=3)
     peak_charges = {}
-    for i, (vtype, reg, _, _, _) in enumerate(vehicles_data):
-        exit_ticket = manager.retrieve_vehicle(reg + "_2")
-        peak_charges[reg] = exit_ticket.charge_amount
-        print(f"  {reg}: ${exit_ticket.charge_amount:.2f}")
-    
-    print("\n" + "-"*70)
+    with manager.bulk_mode():
+        for vtype, reg, make, model, color in _STRATEGY_DEMO_VEHICLES:
+            # Same vehicle details under a new registration for the second
+            # parking; the factory memoizes, so reruns reuse the instance
+            vehicle2 = VehicleFactory.create_vehicle(vtype, reg + "_2", make, model, color)
+            ticket = manager.park_vehicle(vehicle2)
+            ticket.entry_time = peak_entry
+            exit_ticket = manager.retrieve_vehicle(vehicle2.registration_number)
+            peak_charges[reg] = exit_ticket.charge_amount
+            print(f"  {reg}: ${exit_ticket.charge_amount:.2f}")
+    print(f"  ({len(peak_charges)} park/retrieve cycles, observers muted)")
+    
+    print("\n" + _LIGHT_RULE)
     print("COMPARISON:")
     print(f"{'Vehicle':<10} {'Basic':<12} {'Peak Hour':<12} {'Difference'}")
-    print("-"*70)
-    for reg in basic_charges:
-        basic = basic_charges[reg]
+    print(_LIGHT_RULE)
+    for reg, basic in basic_charges.items():
         peak = peak_charges[reg]
-        diff = peak - basic
-        print(f"{reg:<10} ${basic:>10.2f} ${peak:>10.2f} ${diff:>10.2f}")
+        print(_COMPARISON_ROW(reg, basic, peak, peak - basic))
     
     print("\n✓ Strategy Pattern Benefits:")
     print("  - Change algorithm at runtime without modifying code")
@@ -280,6 +346,11 @@ def demo_strategy_pattern(manager):
 
 def demo_observer_pattern():
     """Demonstrate the Observer Pattern."""
+    from ParkingManager_Refactored import (
+        ParkingManager, ParkingSpace, ParkingSpaceSize, BasicPricingStrategy,
+        LoggingObserver, ChargingStationObserver
+    )
+    
     print_header("DEMO 5: OBSERVER PATTERN - Event Notifications")
     
     print_subheader("Observers receive notifications of events")
@@ -332,6 +403,11 @@ def demo_observer_pattern():
 
 def demo_reporting():
     """Demonstrate reporting and analytics."""
+    from ParkingManager_Refactored import (
+        ParkingManager, ParkingSpace, ParkingSpaceSize, BasicPricingStrategy,
+        LoggingObserver
+    )
+    
     print_header("DEMO 6: REPORTING & ANALYTICS")
     
     print_subheader("Setting up parking lot with multiple transactions")
@@ -353,78 +429,98 @@ def demo_reporting():
     # Simulate multiple parking transactions
     print("Processing multiple parking transactions...\n")
     
-    transactions = [
-        (VehicleType.CAR, "A123", "Toyota", "Camry", "Red", 2),
-        (VehicleType.CAR, "B456", "Honda", "Accord", "Blue", 1.5),
-        (VehicleType.MOTORCYCLE, "M789", "Harley", "Street", "Black", 0.75),
-        (VehicleType.TRUCK, "T001", "Ford", "F-150", "White", 3),
-        (VehicleType.CAR, "C111", "Tesla", "Model 3", "Silver", 4),
-    ]
-    
-    for vtype, reg, make, model, color, hours in transactions:
-        vehicle = VehicleFactory.create_vehicle(vtype, reg, make, model, color)
-        ticket = manager.park_vehicle(vehicle)
-        # Simulate time passed
-        ticket.entry_time = datetime.now() - timedelta(hours=hours)
-        manager.retrieve_vehicle(reg)
-        print(f"✓ {vtype.value}: {reg} - {hours} hours")
-    
-    print("\n" + "-"*70)
+    now = datetime.now()
+    with manager.bulk_mode():
+        for vtype, reg, make, model, color, hours in _REPORTING_TRANSACTIONS:
+            vehicle = VehicleFactory.create_vehicle(vtype, reg, make, model, color)
+            ticket = manager.park_vehicle(vehicle)
+            # Simulate time passed
+            ticket.entry_time = now - timedelta(hours=hours)
+            manager.retrieve_vehicle(reg)
+            print(f"✓ {vtype.label}: {reg} - {hours} hours")
+    print(f"  ({len(_REPORTING_TRANSACTIONS)} transactions, observers muted)")
+    
+    print("\n" + _LIGHT_RULE)
     print_subheader("Parking Lot Summary")
     
     summary = manager.get_parking_summary()
-    print(f"Total Spaces: {summary['total_spaces']}")
-    print(f"Occupied Spaces: {summary['occupied_spaces']}")
-    print(f"Available Spaces: {summary['available_spaces']}")
-    print(f"Occupancy Rate: {summary['occupancy_rate']:.1f}%")
-    print(f"Active Vehicles: {summary['active_vehicles']}")
-    print(f"Total Transactions: {summary['total_transactions']}")
-    print(f"Current Strategy: {summary['pricing_strategy']}")
-    print(f"Total Revenue: ${summary['total_revenue']:.2f}\n")
+    total_spaces = summary['total_spaces']
+    occupied_spaces = summary['occupied_spaces']
+    available_spaces = summary['available_spaces']
+    occupancy_rate = summary['occupancy_rate']
+    active_vehicles = summary['active_vehicles']
+    total_transactions = summary['total_transactions']
+    pricing_strategy = summary['pricing_strategy']
+    total_revenue = summary['total_revenue']
+    print(f"Total Spaces: {total_spaces}")
+    print(f"Occupied Spaces: {occupied_spaces}")
+    print(f"Available Spaces: {available_spaces}")
+    print(f"Occupancy Rate: {occupancy_rate:.1f}%")
+    print(f"Active Vehicles: {active_vehicles}")
+    print(f"Total Transactions: {total_transactions}")
+    print(f"Current Strategy: {pricing_strategy}")
+    print(f"Total Revenue: ${total_revenue:.2f}\n")
     
     print_subheader("Revenue Breakdown by Vehicle Type")
-    revenue_by_type = manager.get_revenue_by_vehicle_type()
-    total = sum(revenue_by_type.values())
-    for vtype, amount in revenue_by_type.items():
-        percentage = (amount / total * 100) if total > 0 else 0
-        print(f"  {vtype.value:<15}: ${amount:>8.2f} ({percentage:>5.1f}%)")
-    print(f"  {'TOTAL':<15}: ${total:>8.2f} (100.0%)")
+    revenue = revenue_by_type(manager)
+    # Parallel type/amount columns; percentages computed in one pass
+    types = list(revenue)
+    if np is not None:
+        amounts = np.fromiter(revenue.values(), dtype=np.float64, count=len(types))
+        total = float(amounts.sum())
+        scale = 100.0 / total if total > 0 else 0.0
+        percentages = (amounts * scale).tolist()
+        amounts = amounts.tolist()
+    else:
+        amounts = list(revenue.values())
+        total = sum(amounts)
+        scale = 100.0 / total if total > 0 else 0.0
+        percentages = [amount * scale for amount in amounts]
+    for vtype, amount, percentage in zip(types, amounts, percentages):
+        print(_REVENUE_ROW(vtype.label, amount, percentage))
+    print(_REVENUE_ROW("TOTAL", total, 100.0))
 
 
 def main():
     """Run all demonstrations."""
-    print("\n")
-    print("╔" + "═"*68 + "╗")
-    print("║" + " "*68 + "║")
-    print("║" + "PARKING MANAGEMENT SYSTEM - DESIGN PATTERNS DEMO".center(68) + "║")
-    print("║" + " "*68 + "║")
-    print("╚" + "═"*68 + "╝")
-    
-    print("\nThis demo showcases:")
-    print("  • Factory Pattern - Encapsulating object creation")
-    print("  • Decorator Pattern - Adding features dynamically")
-    print("  • Strategy Pattern - Pluggable algorithms")
-    print("  • Observer Pattern - Event-driven notifications")
-    print("  • SOLID Principles - Maintainable, extensible code")
+    # LoggingObserver reports through logging; show its INFO events inline
+    logging.basicConfig(level=logging.INFO, handlers=[_LOG_HANDLER])
+    
+    with buffered_output():
+        sys.stdout.write(_BANNER)
+        
+        print("\nThis demo showcases:")
+        print("  • Factory Pattern - Encapsulating object creation")
+        print("  • Decorator Pattern - Adding features dynamically")
+        print("  • Strategy Pattern - Pluggable algorithms")
+        print("  • Observer Pattern - Event-driven notifications")
+        print("  • SOLID Principles - Maintainable, extensible code")
     
     try:
-        # Run demos
-        demo_factory_pattern()
-        demo_decorator_pattern()
-        manager = demo_parking_basic()
-        demo_strategy_pattern(manager)
-        demo_observer_pattern()
-        demo_reporting()
+        # Run demos, writing each one's output in a single call
+        with buffered_output():
+            demo_factory_pattern()
+        with buffered_output():
+            demo_decorator_pattern()
+        with buffered_output():
+            manager = demo_parking_basic()
+        with buffered_output():
+            demo_strategy_pattern(manager)
+        with buffered_output():
+            demo_observer_pattern()
+        with buffered_output():
+            demo_reporting()
         
         # Final message
-        print_header("DEMO COMPLETE!")
-        print("\n✓ All design patterns demonstrated successfully!")
-        print("\nNext steps:")
-        print("  1. Modify the code and experiment with different scenarios")
-        print("  2. Add new vehicle types in Vehicle_Refactored.py")
-        print("  3. Create new pricing strategies in ParkingManager_Refactored.py")
-        print("  4. Build a web interface using Flask or FastAPI")
-        print("\nHappy parking! 🚗\n")
+        with buffered_output():
+            print_header("DEMO COMPLETE!")
+            print("\n✓ All design patterns demonstrated successfully!")
+            print("\nNext steps:")
+            print("  1. Modify the code and experiment with different scenarios")
+            print("  2. Add new vehicle types in Vehicle_Refactored.py")
+            print("  3. Create new pricing strategies in ParkingManager_Refactored.py")
+            print("  4. Build a web interface using Flask or FastAPI")
+            print("\nHappy parking! 🚗\n")
         
     except Exception as e:
         print(f"\n❌ Error during demo: {e}")
@@ -0,0 +1,24 @@
+"""
+Test package for the parking management system.
+
+The parking module's file name contains a space, so it can't be imported
+with a plain import statement; it is loaded here once, under the module
+name main.py uses, so tests can simply `import ParkingManager_Refactored`.
+"""
+
+import importlib.util
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+if "ParkingManager_Refactored" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        "ParkingManager_Refactored",
+        os.path.join(_ROOT, "ParkingManager_Refactored .py"),
+    )
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules["ParkingManager_Refactored"] = _module
+    _spec.loader.exec_module(_module)
@@ -0,0 +1,95 @@
+"""Tests for ParkingManager.bulk_mode()."""
+
+import unittest
+
+from Vehicle_Refactored import VehicleType, create_vehicle
+from ParkingManager_Refactored import (
+    BasicPricingStrategy, ParkingEventObserver, ParkingManager, ParkingSpace,
+    ParkingSpaceSize,
+)
+
+
+class RecordingObserver(ParkingEventObserver):
+    """Observer that records the events it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_vehicle_entry(self, ticket):
+        self.events.append(("entry", ticket.vehicle.registration_number))
+
+    def on_vehicle_exit(self, ticket):
+        self.events.append(("exit", ticket.vehicle.registration_number))
+
+    def on_space_available(self, space):
+        self.events.append(("space", space.space_id))
+
+
+class BulkModeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ParkingManager(BasicPricingStrategy())
+        self.manager.add_multiple_spaces([
+            ParkingSpace("S1", ParkingSpaceSize.STANDARD, floor=1, location="A1"),
+            ParkingSpace("S2", ParkingSpaceSize.STANDARD, floor=1, location="A2"),
+        ])
+
+    def cycle(self, registration_number):
+        """Park and retrieve one car."""
+        car = create_vehicle(VehicleType.CAR, registration_number,
+                             "Honda", "Civic", "Blue")
+        self.manager.park_vehicle(car)
+        self.manager.retrieve_vehicle(registration_number)
+
+    def test_notifications_suspended_inside_block(self):
+        observer = RecordingObserver()
+        self.manager.attach_observer(observer)
+        with self.manager.bulk_mode():
+            self.cycle("BULK1")
+        self.assertEqual(observer.events, [])
+        self.cycle("BULK2")
+        self.assertEqual([event for event, _ in observer.events],
+                         ["entry", "exit", "space"])
+
+    def test_nested_blocks(self):
+        observer = RecordingObserver()
+        self.manager.attach_observer(observer)
+        with self.manager.bulk_mode():
+            with self.manager.bulk_mode():
+                self.cycle("BULK1")
+            self.cycle("BULK2")
+        self.assertEqual(observer.events, [])
+
+    def test_attach_inside_block(self):
+        observer = RecordingObserver()
+        with self.manager.bulk_mode():
+            self.manager.attach_observer(observer)
+            self.cycle("BULK1")
+        self.assertEqual(observer.events, [])
+        self.cycle("BULK2")
+        self.assertEqual(len(observer.events), 3)
+        # Attached inside the block, detachable after it
+        self.manager.detach_observer(observer)
+        self.cycle("BULK3")
+        self.assertEqual(len(observer.events), 3)
+
+    def test_detach_inside_block(self):
+        observer = RecordingObserver()
+        self.manager.attach_observer(observer)
+        with self.manager.bulk_mode():
+            self.manager.detach_observer(observer)
+        self.cycle("BULK1")
+        self.assertEqual(observer.events, [])
+
+    def test_restored_after_exception(self):
+        observer = RecordingObserver()
+        self.manager.attach_observer(observer)
+        with self.assertRaises(RuntimeError):
+            with self.manager.bulk_mode():
+                raise RuntimeError("boom")
+        self.cycle("BULK1")
+        self.assertEqual(len(observer.events), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
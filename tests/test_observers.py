@@ -0,0 +1,87 @@
+"""Tests for observer attach/detach during notifications."""
+
+import unittest
+
+from Vehicle_Refactored import VehicleType, create_vehicle
+from ParkingManager_Refactored import (
+    BasicPricingStrategy, ParkingEventObserver, ParkingManager, ParkingSpace,
+    ParkingSpaceSize,
+)
+
+
+class SelfDetachingObserver(ParkingEventObserver):
+    """Observer that detaches itself on the first event it receives."""
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.events = []
+
+    def on_vehicle_entry(self, ticket):
+        self.events.append("entry")
+        self.manager.detach_observer(self)
+
+    def on_vehicle_exit(self, ticket):
+        self.events.append("exit")
+
+    def on_space_available(self, space):
+        self.events.append("space")
+
+
+class RecordingObserver(ParkingEventObserver):
+    """Observer that records the events it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_vehicle_entry(self, ticket):
+        self.events.append("entry")
+
+    def on_vehicle_exit(self, ticket):
+        self.events.append("exit")
+
+    def on_space_available(self, space):
+        self.events.append("space")
+
+
+class ObserverChangesDuringNotificationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ParkingManager(BasicPricingStrategy())
+        self.manager.add_parking_space(
+            ParkingSpace("S1", ParkingSpaceSize.STANDARD, floor=1, location="A1"))
+        self.car = create_vehicle(VehicleType.CAR, "OBS001", "Honda", "Civic", "Blue")
+
+    def test_observer_detaches_itself(self):
+        detaching = SelfDetachingObserver(self.manager)
+        later = RecordingObserver()
+        self.manager.attach_observer(detaching)
+        self.manager.attach_observer(later)
+
+        ticket = self.manager.park_vehicle(self.car)
+        self.assertEqual(ticket.vehicle, self.car)
+        self.assertEqual(self.manager.get_parking_summary()["occupied_spaces"], 1)
+        # The in-progress dispatch still reaches observers attached after it
+        self.assertEqual(later.events, ["entry"])
+
+        self.manager.retrieve_vehicle("OBS001")
+        self.assertEqual(detaching.events, ["entry"])
+        self.assertEqual(later.events, ["entry", "exit", "space"])
+
+    def test_observer_attaches_another(self):
+        late = RecordingObserver()
+        manager = self.manager
+
+        class Attacher(RecordingObserver):
+            def on_vehicle_entry(self, ticket):
+                super().on_vehicle_entry(ticket)
+                manager.attach_observer(late)
+
+        self.manager.attach_observer(Attacher())
+        self.manager.park_vehicle(self.car)
+        self.assertEqual(late.events, [])
+        self.manager.retrieve_vehicle("OBS001")
+        self.assertEqual(late.events, ["exit", "space"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests that batch rebilling matches the strategies' per-ticket pricing."""
+
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from Vehicle_Refactored import VehicleType, create_electric_vehicle, create_vehicle
+from ParkingManager_Refactored import (
+    BasicPricingStrategy, EvChargingPricingStrategy, ParkingManager,
+    ParkingSpace, ParkingSpaceSize, PeakHourPricingStrategy,
+    SubscriptionPricingStrategy, np,
+)
+
+BUILT_IN_STRATEGIES = (
+    BasicPricingStrategy,
+    PeakHourPricingStrategy,
+    SubscriptionPricingStrategy,
+    EvChargingPricingStrategy,
+)
+
+
+@unittest.skipIf(np is None, "batch rebilling kernel requires NumPy")
+class RebillKernelTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a history of mixed EV/non-EV tickets of every type."""
+        rng = random.Random(12)
+        cls.manager = ParkingManager(BasicPricingStrategy())
+        cls.manager.add_multiple_spaces([
+            ParkingSpace(f"{size.name}{i}", size, floor=1, location=f"{size.name}{i}")
+            for size in ParkingSpaceSize for i in range(2)
+        ])
+        now = datetime.now()
+        for i in range(300):
+            vehicle_type = rng.choice(list(VehicleType))
+            registration_number = f"R{i}"
+            if i % 3 == 0:
+                vehicle = create_electric_vehicle(vehicle_type, registration_number,
+                                                  "Make", "Model", "Color")
+            else:
+                vehicle = create_vehicle(vehicle_type, registration_number,
+                                         "Make", "Model", "Color")
+            ticket = cls.manager.park_vehicle(vehicle)
+            # Short and multi-day stays, with entries spread over a year so
+            # every hour of the day (and any DST transition) is covered
+            ticket.entry_time = now - timedelta(minutes=rng.randint(1, 525_600))
+            cls.manager.retrieve_vehicle(registration_number)
+
+    def test_kernel_matches_calculate_fee(self):
+        tickets = self.manager.get_history()
+        self.assertTrue(any(ticket.is_ev for ticket in tickets))
+        self.assertTrue(any(not ticket.is_ev for ticket in tickets))
+        for strategy_class in BUILT_IN_STRATEGIES:
+            strategy = strategy_class()
+            with self.subTest(strategy=strategy.get_strategy_name()):
+                batch = self.manager.rebill_all(strategy)
+                expected = np.array([strategy.calculate_fee(ticket) for ticket in tickets])
+                np.testing.assert_allclose(batch, expected, rtol=1e-12, atol=0)
+
+    def test_defaults_to_current_strategy(self):
+        expected = self.manager.rebill_all(BasicPricingStrategy())
+        np.testing.assert_array_equal(self.manager.rebill_all(), expected)
+
+    def test_subclass_priced_in_python(self):
+        class DoubleBasic(BasicPricingStrategy):
+            def calculate_fee(self, ticket):
+                return 2 * super().calculate_fee(ticket)
+
+        expected = 2 * self.manager.rebill_all(BasicPricingStrategy())
+        np.testing.assert_allclose(self.manager.rebill_all(DoubleBasic()), expected,
+                                   rtol=1e-12, atol=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for ParkingTicket construction and time handling."""
+
+import unittest
+from datetime import datetime
+
+from Vehicle_Refactored import VehicleType, create_vehicle
+from ParkingManager_Refactored import ParkingSpace, ParkingSpaceSize, ParkingTicket
+
+
+class ParkingTicketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.car = create_vehicle(VehicleType.CAR, "TKT001", "Honda", "Civic", "Blue")
+        self.space = ParkingSpace("S1", ParkingSpaceSize.STANDARD, floor=1, location="A1")
+        self.entry = datetime(2026, 1, 15, 9, 30)
+        self.exit = datetime(2026, 1, 15, 11, 0)
+
+    def test_epoch_seconds(self):
+        ts = int(self.entry.timestamp())
+        ticket = ParkingTicket(1000, self.car, self.space, entry_ts=ts, exit_ts=ts + 5400)
+        self.assertEqual(ticket.entry_time, self.entry)
+        self.assertEqual(ticket.get_duration_hours(), 1.5)
+
+    def test_datetime_keywords(self):
+        ticket = ParkingTicket(1000, self.car, self.space,
+                               entry_time=self.entry, exit_time=self.exit)
+        self.assertEqual(ticket.entry_ts, int(self.entry.timestamp()))
+        self.assertEqual(ticket.exit_time, self.exit)
+        self.assertEqual(ticket.get_duration_hours(), 1.5)
+
+    def test_positional_datetimes(self):
+        ticket = ParkingTicket(1000, self.car, self.space, self.entry, self.exit)
+        self.assertEqual(ticket.entry_time, self.entry)
+        self.assertEqual(ticket.exit_time, self.exit)
+        self.assertFalse(ticket.is_active())
+
+    def test_captures_vehicle_type(self):
+        ticket = ParkingTicket(1000, self.car, self.space, entry_time=self.entry)
+        self.assertIs(ticket.vehicle_type, VehicleType.CAR)
+        self.assertEqual(ticket.type_code, int(VehicleType.CAR))
+        self.assertFalse(ticket.is_ev)
+        self.assertTrue(ticket.is_active())
+
+    def test_entry_required(self):
+        with self.assertRaises(TypeError):
+            ParkingTicket(1000, self.car, self.space)
+
+
+if __name__ == "__main__":
+    unittest.main()
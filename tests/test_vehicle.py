@@ -0,0 +1,44 @@
+"""Tests for the Vehicle subclass contract."""
+
+import unittest
+
+from Vehicle_Refactored import SpaceSize, Vehicle, VehicleSpecification, VehicleType
+
+
+class VehicleSubclassTest(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = VehicleSpecification("SUB001", "Make", "Model", "Color")
+
+    def test_vehicle_not_instantiable(self):
+        with self.assertRaises(TypeError):
+            Vehicle(self.spec)
+
+    def test_concrete_subclass_must_define_type_and_size(self):
+        with self.assertRaises(TypeError):
+            class Incomplete(Vehicle):
+                TYPE = VehicleType.CAR
+
+    def test_abstract_intermediate_base(self):
+        class ElectricVehicleBase(Vehicle, abstract=True):
+            __slots__ = ()
+
+        with self.assertRaises(TypeError):
+            ElectricVehicleBase(self.spec)
+
+        class ElectricCar(ElectricVehicleBase):
+            __slots__ = ()
+            TYPE = VehicleType.CAR
+            SPACE_SIZE = SpaceSize.STANDARD
+
+        car = ElectricCar(self.spec)
+        self.assertIs(car.get_type(), VehicleType.CAR)
+        self.assertIs(car.get_parking_space_size(), SpaceSize.STANDARD)
+
+        with self.assertRaises(TypeError):
+            class Incomplete(ElectricVehicleBase):
+                SPACE_SIZE = SpaceSize.STANDARD
+
+
+if __name__ == "__main__":
+    unittest.main()